@@ -12,12 +12,26 @@ from .extensions import NewelleExtension
 from .tools import Tool, ToolResult
 from .handlers.extra_settings import ExtraSettings
 from .handlers import TabButtonDescription
+import functools
+import mmap
 import os
-import datetime
+import operator
 import re
+import sys
+import tempfile
+import queue
 import threading
-import difflib
-from gi.repository import Gtk, Gio, GLib, Pango
+import time
+import weakref
+from collections import OrderedDict, defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import NamedTuple
+from gi.repository import Gtk, Gio, GLib, GObject, Pango
+
+try:
+    from rapidfuzz import fuzz as _rapidfuzz
+except ImportError:
+    _rapidfuzz = None
 
 
 # Templates for planning files
@@ -34,11 +48,11 @@ Status: In Progress
 ## Decisions
 <!-- Record key decisions here -->
 
-## Error Log
-<!-- Log any errors or failed attempts here -->
-
 ## Notes
 <!-- Additional notes and observations -->
+
+## Error Log
+<!-- Log any errors or failed attempts here -->
 """
 
 FINDINGS_TEMPLATE = """# Findings: {task_name}
@@ -50,12 +64,12 @@ Created: {date}
 ## Technical Decisions
 <!-- Record technical choices and rationale -->
 
-## Key Discoveries
-
 ## References
 
 ## Code Snippets
 <!-- Important code patterns found -->
+
+## Key Discoveries
 """
 
 PROGRESS_TEMPLATE = """# Progress Log: {task_name}
@@ -69,20 +83,631 @@ Created: {date}
 4. What information is missing?
 5. Are there any errors or blockers?
 
+## Test Results
+<!-- Document test outcomes here -->
+| Test | Result | Notes |
+|------|--------|-------|
+
+## Next Steps
+
 ## Session Log
 
 ### {date}
 - Started task
 - Created planning files
+"""
 
-## Test Results
-<!-- Document test outcomes here -->
-| Test | Result | Notes |
-|------|--------|-------|
+# The files making up one planning session, in display order
+PLANNING_FILES = ("task_plan.md", "findings.md", "progress.md")
 
-## Next Steps
+# Characters of task_plan.md parsed for the widgets and status; a plan
+# grown past this is only partially reflected, with a warning
+_PLAN_PARSE_LIMIT = 1 << 20
+
+# Restored tool widgets kept for reuse, least recently used dropped first
+_WIDGET_CACHE_SIZE = 64
+
+# Patterns for parsing task_plan.md, compiled once at import
+_RE_PHASE = re.compile(r'^###\s+(.+)$')
+_RE_TODO = re.compile(r'^-\s+\[([ x])\]\s+(.+)$')
+
+def _fuzzy_ratio(target: str, text: str, floor: float) -> float:
+    """Similarity of two strings in [0, 1], or 0.0 when it cannot exceed floor.
+
+    Uses rapidfuzz when installed, otherwise difflib behind its cheap
+    upper bounds so hopeless candidates skip the full comparison.
+    """
+    if _rapidfuzz is not None:
+        return _rapidfuzz.ratio(target, text, score_cutoff=floor * 100) / 100
+    import difflib  # only needed once mark_complete falls back to fuzzy matching
+    matcher = difflib.SequenceMatcher(None, target, text)
+    if matcher.real_quick_ratio() <= floor or matcher.quick_ratio() <= floor:
+        return 0.0
+    return matcher.ratio()
+
+
+# Patterns for locating and ticking open checkboxes in mark_complete
+# An unchecked item: group 1 runs up to its "[ ]", group 2 holds the text
+_RE_OPEN_TODO = re.compile(r'(\s*[-*]\s*)\[ \]\s*(.*)')
+
+class Todo(NamedTuple):
+    """One checkbox line of task_plan.md"""
+    text: str
+    completed: bool
+    phase: str | None
+
+
+class TodoStats(NamedTuple):
+    """Todo counts computed once per parse and shared by every widget"""
+    total: int
+    completed: int
+    errors: int
+    by_phase: dict
+
+
+def _todo_stats(todos: list, errors: int = 0) -> TodoStats:
+    # Phases keep the order of their first todo in the file
+    by_phase = defaultdict(list)
+    for todo in todos:
+        by_phase[todo.phase].append(todo)
+    # Stop lookups by the widgets from inserting empty phases
+    by_phase.default_factory = None
+    completed = sum(map(operator.attrgetter('completed'), todos))
+    return TodoStats(len(todos), completed, errors, by_phase)
+
+
+EMPTY_STATS = TodoStats(0, 0, 0, {})
+
+DEFAULT_PHASES = """### Phase 1: Planning
+- [ ] Define requirements
+- [ ] Identify dependencies
+- [ ] Create initial plan
+"""
+
+
+def _last_heading(content: str) -> str | None:
+    """The last "## " heading line of content, found from the tail"""
+    start = content.rfind("\n## ") + 1
+    if not start:
+        return None
+    end = content.find("\n", start)
+    return content[start:end] if end != -1 else content[start:]
+
+
+def _section_last(content: str, marker: str) -> str:
+    """Return content with the section under marker moved to the end,
+    creating it if missing, so new entries are appended to the file"""
+    # Usually it already is; that is answered without scanning the head
+    if _last_heading(content) == marker:
+        return content
+    start = content.find(marker)
+    if start == -1:
+        return content.rstrip() + f"\n\n{marker}\n"
+    end = content.find("\n## ", start + len(marker))
+    if end == -1:
+        return content
+    section = content[start:end].rstrip()
+    return (content[:start] + content[end + 1:]).rstrip() + f"\n\n{section}\n"
+
+
+def _compile_template(template: str) -> tuple:
+    """Split a template into encoded literal runs alternating with the
+    names of the fields between them"""
+    parts = re.split(r'\{(\w+)\}', template)
+    return tuple(part if i % 2 else part.encode('utf-8') for i, part in enumerate(parts))
+
+
+# Created with every plan; joined from bytes instead of parsed by
+# str.format and encoded each time
+_TASK_PLAN_PARTS = _compile_template(TASK_PLAN_TEMPLATE)
+_FINDINGS_PARTS = _compile_template(FINDINGS_TEMPLATE)
+_PROGRESS_PARTS = _compile_template(PROGRESS_TEMPLATE)
+
+
+def _render_template(parts: tuple, fields: dict) -> bytes:
+    return b"".join(part if i % 2 == 0 else fields[part] for i, part in enumerate(parts))
+
+
+def render_plan_bundle(task_name: str, date: str, objective: str, phases: list[str] = None) -> list[tuple[str, bytes]]:
+    """Render the three planning files as (filename, encoded content) pairs"""
+    if not phases:
+        phases_content = DEFAULT_PHASES
+    else:
+        phases_content = "\n\n".join(
+            f"### Phase {i}: {phase}\n- [ ] " for i, phase in enumerate(phases, 1)
+        ).rstrip()
+    fields = {
+        'task_name': task_name.encode('utf-8'),
+        'date': date.encode('utf-8'),
+        'objective': objective.encode('utf-8'),
+        'phases': phases_content.encode('utf-8'),
+    }
+    return [
+        ("task_plan.md", _render_template(_TASK_PLAN_PARTS, fields)),
+        ("findings.md", _render_template(_FINDINGS_PARTS, fields)),
+        ("progress.md", _render_template(_PROGRESS_PARTS, fields)),
+    ]
+
+
+def _write_all(fd: int, data: bytes):
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def _atomic_write(path: str, data: bytes, sync: bool = False):
+    """Replace path with data through a sibling temporary file, so readers
+    and crashes see either the old or the new content, never a mix. Each
+    call gets its own temporary file, so concurrent writers cannot truncate
+    or rename one another's."""
+    directory, filename = os.path.split(path)
+    fd, tmp_path = tempfile.mkstemp(dir=directory or ".", prefix=f".{filename}.")
+    try:
+        try:
+            # mkstemp creates 0600; planning files keep the usual mode
+            os.fchmod(fd, 0o644)
+            _write_all(fd, data)
+            if sync:
+                os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except Exception:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _tool_error(action: str = None):
+    """Turn an exception escaping a tool method into its result text
+    instead of wrapping every body in the same try/except"""
+    prefix = f"❌ Error {action}: " if action else "❌ Error: "
+    
+    def decorate(method):
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            try:
+                return method(*args, **kwargs)
+            except FileNotFoundError as e:
+                return f"⚠️ {e}"
+            except Exception as e:
+                print(f"Planning {method.__name__} failed: {e!r}")
+                return prefix + str(e)
+        return wrapper
+    return decorate
+
+
+def _editing(filename: str):
+    """Hold the lock of a planning file around a read-modify-write method,
+    so concurrent tool calls cannot write back stale copies of it"""
+    def decorate(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with self._file_lock(filename):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorate
+
+
+class AsyncArtifactWriter:
+    """Writes planning files on a background thread, in submission order"""
+    
+    def __init__(self):
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+    
+    def enqueue(self, path: str, data: bytes, critical: bool = False, callback=None) -> Future:
+        """Queue a full rewrite of path; critical writes are fsynced.
+        callback(path) runs on the GTK main loop once the write landed.
+        The returned future holds the exception of a failed write."""
+        return self._submit(self._write_file, (path, data, critical), (path,), callback)
+    
+    def enqueue_bundle(self, directory: str, files: list[tuple[str, bytes]], callback=None) -> Future:
+        """Queue (filename, data) pairs that each replace their target
+        atomically, made durable together by one directory fsync"""
+        paths = tuple(os.path.join(directory, filename) for filename, _ in files)
+        return self._submit(self._write_bundle, (directory, files), paths, callback)
+    
+    def flush(self):
+        """Block until every queued write has landed"""
+        self._queue.join()
+    
+    def _submit(self, func, args: tuple, paths: tuple, callback) -> Future:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._drain, name="planning-writer", daemon=True)
+                self._thread.start()
+        future = Future()
+        self._queue.put((func, args, paths, callback, future))
+        return future
+    
+    def _drain(self):
+        while True:
+            func, args, paths, callback, future = self._queue.get()
+            try:
+                func(*args)
+            except Exception as e:
+                # Any failure stays with its job; the thread keeps draining
+                # so flush() can never wait on a dead writer
+                print(f"Planning write error ({', '.join(paths)}): {e}")
+                future.set_exception(e)
+            else:
+                future.set_result(None)
+                if callback:
+                    for path in paths:
+                        GLib.idle_add(callback, path)
+            finally:
+                self._queue.task_done()
+    
+    def _write_file(self, path: str, data: bytes, critical: bool):
+        _atomic_write(path, data, sync=critical)
+    
+    def _write_bundle(self, directory: str, files: list[tuple[str, bytes]]):
+        for filename, data in files:
+            _atomic_write(os.path.join(directory, filename), data, sync=True)
+        # The renames are durable once the directory entry is
+        dir_fd = os.open(directory, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+class PlanJournal:
+    """Appends entries to the last section of the planning files.
+
+    Key Discoveries, Session Log and Error Log come last in their
+    templates, and older files are reordered on their first rewrite, so a
+    new entry is a plain append through a cached O_APPEND descriptor. The journal only
+    appends while the file is exactly as it last saw it; after an outside
+    edit append() returns False and the caller rewrites the file instead.
+    """
+    
+    def __init__(self):
+        self._fds = {}
+        self._tails = {}
+        self._lock = threading.Lock()
+    
+    def append(self, path: str, heading: str, data: bytes) -> bool:
+        """Append data if path still ends inside the section heading"""
+        with self._lock:
+            tail = self._tails.get(path)
+            if tail is None or tail[3] != heading:
+                return False
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                return False
+            if (st.st_ino, st.st_mtime_ns, st.st_size) != tail[:3]:
+                return False
+            fd = self._fd(path, st.st_ino)
+            _write_all(fd, data)
+            st = os.fstat(fd)
+            self._tails[path] = (st.st_ino, st.st_mtime_ns, st.st_size, heading)
+            return True
+    
+    def remember(self, path: str, content: str):
+        """Record the state of path after content was written to it"""
+        heading = _last_heading(content)
+        with self._lock:
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                self._tails.pop(path, None)
+                return
+            self._tails[path] = (st.st_ino, st.st_mtime_ns, st.st_size, heading)
+    
+    def close(self):
+        """Close cached descriptors and forget every file"""
+        with self._lock:
+            for ino, fd in self._fds.values():
+                os.close(fd)
+            self._fds.clear()
+            self._tails.clear()
+    
+    def _fd(self, path: str, ino: int) -> int:
+        cached = self._fds.get(path)
+        if cached is not None:
+            if cached[0] == ino:
+                return cached[1]
+            os.close(cached[1])
+        fd = os.open(path, os.O_WRONLY | os.O_APPEND)
+        self._fds[path] = (ino, fd)
+        return fd
+
+
+# Per-widget rules, concatenated below into the one stylesheet shared by
+# every planning widget. It is registered once per display by _ensure_css()
+# instead of once per widget instance.
+_HEADER_CSS = b"""
+    .planning-header {
+        background: linear-gradient(135deg, alpha(@accent_bg_color, 0.15), alpha(@accent_bg_color, 0.05));
+        border-radius: 12px 12px 0 0;
+        padding: 16px;
+    }
+    .planning-progress-ring {
+        font-size: 28px;
+        font-weight: 700;
+        color: @accent_color;
+    }
+    .planning-stat-box {
+        background: alpha(@card_bg_color, 0.5);
+        border-radius: 8px;
+        padding: 12px;
+        min-width: 80px;
+    }
+    .planning-stat-value {
+        font-size: 20px;
+        font-weight: 700;
+    }
+    .planning-stat-label {
+        font-size: 11px;
+        opacity: 0.7;
+    }
+    .planning-file-chip {
+        background: alpha(@success_bg_color, 0.15);
+        border-radius: 16px;
+        padding: 4px 12px;
+        font-size: 12px;
+    }
+    .planning-file-chip.missing {
+        background: alpha(@warning_bg_color, 0.15);
+    }
+    .error-badge {
+        background: alpha(@error_bg_color, 0.2);
+        color: @error_color;
+        border-radius: 12px;
+        padding: 2px 10px;
+        font-weight: 600;
+    }
 """
 
+_TODO_CSS = b"""
+    .todo-list {
+        background: transparent;
+    }
+    .todo-header {
+        padding: 12px 16px;
+        background: alpha(@accent_bg_color, 0.08);
+    }
+    .todo-item {
+        padding: 8px 16px;
+        border-bottom: 1px solid alpha(@borders, 0.3);
+    }
+    .todo-item:last-child {
+        border-bottom: none;
+    }
+    .todo-completed .todo-text {
+        text-decoration: line-through;
+        opacity: 0.5;
+    }
+    .phase-header {
+        background: alpha(@view_bg_color, 0.5);
+        padding: 6px 16px;
+        font-weight: 600;
+        font-size: 12px;
+    }
+"""
+
+_FINDING_CSS = b"""
+    .finding-header {
+        background: linear-gradient(90deg, alpha(@blue_3, 0.12), transparent);
+        padding: 12px 16px;
+        border-radius: 12px 12px 0 0;
+    }
+    .finding-content {
+        padding: 12px 16px;
+    }
+    .finding-category {
+        background: alpha(@accent_bg_color, 0.15);
+        border-radius: 4px;
+        padding: 2px 8px;
+        font-size: 11px;
+    }
+"""
+
+_ERROR_CSS = b"""
+    .error-widget-header {
+        background: linear-gradient(90deg, alpha(@error_bg_color, 0.2), transparent);
+        padding: 12px 16px;
+        border-radius: 12px 12px 0 0;
+    }
+    .error-content {
+        padding: 12px 16px;
+        background: alpha(@error_bg_color, 0.05);
+    }
+    .error-reminder {
+        background: alpha(@warning_bg_color, 0.1);
+        border-radius: 8px;
+        padding: 8px 12px;
+        margin: 8px 16px 12px 16px;
+    }
+"""
+
+_CREATED_CSS = b"""
+    .plan-created-header {
+        background: linear-gradient(135deg, alpha(@success_bg_color, 0.2), alpha(@accent_bg_color, 0.1));
+        padding: 20px;
+        border-radius: 12px 12px 0 0;
+    }
+    .plan-created-files {
+        padding: 16px;
+    }
+    .file-row {
+        padding: 8px 12px;
+        border-radius: 8px;
+        background: alpha(@card_bg_color, 0.5);
+        margin-bottom: 8px;
+    }
+    .plan-tip {
+        background: alpha(@accent_bg_color, 0.1);
+        border-radius: 8px;
+        padding: 12px;
+        margin: 0 16px 16px 16px;
+    }
+"""
+
+_MINI_CSS = b"""
+    .planning-mini-header {
+        background: linear-gradient(135deg, alpha(@accent_bg_color, 0.15), alpha(@blue_3, 0.08));
+        padding: 16px;
+    }
+    .planning-mini-content {
+        background: alpha(@view_bg_color, 0.3);
+    }
+    .planning-mini-status {
+        background: alpha(@success_bg_color, 0.15);
+        border-radius: 12px;
+        padding: 4px 12px;
+        font-size: 12px;
+    }
+    .planning-mini-status.active {
+        background: alpha(@warning_bg_color, 0.2);
+    }
+    .file-content-box {
+        background: alpha(@card_bg_color, 0.5);
+        border-radius: 8px;
+        padding: 12px;
+        margin: 8px;
+    }
+    .file-content-text {
+        font-family: monospace;
+        font-size: 12px;
+    }
+"""
+
+_PLANNING_CSS_FANCY = _HEADER_CSS + _TODO_CSS + _FINDING_CSS + _ERROR_CSS + _CREATED_CSS + _MINI_CSS
+
+# GSK's software (cairo) renderer pays heavily for gradients, rounded corners
+# and shadows. GSK_RENDERER is the only renderer hint available before any
+# widget is realized.
+_SOFTWARE_GSK = os.environ.get("GSK_RENDERER", "").lower() in ("cairo", "software")
+
+
+def _flatten_css(css: bytes) -> bytes:
+    """Strip the expensive effects from a stylesheet"""
+    # Keep the first color stop of each gradient as a solid background
+    css = re.sub(rb'linear-gradient\(\s*[^,]+,\s*(alpha\([^)]*\)|[^,)]+).*\);', rb'\1;', css)
+    css = re.sub(rb'border-radius:[^;]*;', b'border-radius: 0;', css)
+    return re.sub(rb'\n\s*box-shadow:[^;]*;', b'', css)
+
+
+_PLANNING_CSS_FLAT = _flatten_css(_PLANNING_CSS_FANCY)
+
+_lightweight_theme = _SOFTWARE_GSK
+
+
+def _planning_css() -> bytes:
+    return _PLANNING_CSS_FLAT if _lightweight_theme else _PLANNING_CSS_FANCY
+
+
+# Registered providers by (display name, stylesheet key). Keyed by name
+# rather than the Gdk.Display wrapper, which PyGObject may recreate.
+_CSS_PROVIDERS: dict = {}
+_CSS_LOCK = threading.Lock()
+
+
+def _ensure_css(display, key: str, css_bytes: bytes):
+    """Register a stylesheet on the display unless it was already added"""
+    registration = (display.get_name(), key)
+    if registration in _CSS_PROVIDERS:
+        return
+    with _CSS_LOCK:
+        if registration in _CSS_PROVIDERS:
+            return
+        css_provider = Gtk.CssProvider()
+        css_provider.load_from_data(css_bytes)
+        Gtk.StyleContext.add_provider_for_display(
+            display,
+            css_provider,
+            Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
+        )
+        _CSS_PROVIDERS[registration] = css_provider
+
+
+def _set_lightweight_theme(enabled: bool):
+    """Switch the planning stylesheet, reloading providers already in use"""
+    global _lightweight_theme
+    if enabled == _lightweight_theme:
+        return
+    _lightweight_theme = enabled
+    with _CSS_LOCK:
+        providers = list(_CSS_PROVIDERS.items())
+    for (display_name, key), css_provider in providers:
+        if key == "planning":
+            css_provider.load_from_data(_planning_css())
+
+
+# GtkInscription (GTK 4.8+) renders single-line text without the size
+# negotiation a GtkLabel does on every measure
+_HAS_INSCRIPTION = hasattr(Gtk, "Inscription")
+
+# Natural width cap for non-wrapping text, in characters
+_FIXED_LABEL_CHARS = 40
+
+
+def _fixed_label(text: str, css_classes=(), xalign: float = 0, **kwargs) -> Gtk.Widget:
+    """Create a non-wrapping text widget, ellipsized when space runs out"""
+    if _HAS_INSCRIPTION:
+        return Gtk.Inscription(
+            text=text,
+            min_chars=0,
+            nat_chars=min(len(text), _FIXED_LABEL_CHARS),
+            xalign=xalign,
+            text_overflow=Gtk.InscriptionOverflow.ELLIPSIZE_END,
+            css_classes=list(css_classes),
+            **kwargs,
+        )
+    return Gtk.Label(
+        label=text,
+        xalign=xalign,
+        ellipsize=Pango.EllipsizeMode.END,
+        single_line_mode=True,
+        max_width_chars=_FIXED_LABEL_CHARS,
+        css_classes=list(css_classes),
+        **kwargs,
+    )
+
+
+def _ellipsize(text: str, limit: int) -> str:
+    """Cut text to limit characters plus an ellipsis; short text is returned as is.
+
+    The cut backs off over combining marks and zero-width joiners so it does
+    not split the character cluster a user would see as one glyph.
+    """
+    if len(text) <= limit:
+        return text
+    import unicodedata
+    cut = limit
+    while cut > 0 and (unicodedata.combining(text[cut]) or text[cut] in "\u200d\ufe0f"
+                       or text[cut - 1] == "\u200d"):
+        cut -= 1
+    return text[:cut or limit] + "…"
+
+
+def _icon(name: str, size: int, css: tuple[str, ...] = ()) -> Gtk.Image:
+    """Create a themed icon with its size and style classes set at construction"""
+    return Gtk.Image(icon_name=name, pixel_size=size, css_classes=list(css))
+
+
+def _open_folder(path: str):
+    """Show a directory in the default file manager without spawning a shell"""
+    uri = Gio.File.new_for_path(path).get_uri()
+    try:
+        Gio.AppInfo.launch_default_for_uri_async(uri, None, None, _on_folder_opened, path)
+    except GLib.Error as e:
+        print(f"Could not open planning directory {path}: {e}")
+
+
+def _on_folder_opened(source, result, path):
+    try:
+        Gio.AppInfo.launch_default_for_uri_finish(result)
+    except GLib.Error as e:
+        print(f"Could not open planning directory {path}: {e}")
+
 
 # ===================== MODERN GTK WIDGETS =====================
 
@@ -90,138 +715,83 @@ class PlanningStatusWidget(Gtk.Box):
     """Modern widget displaying planning status with glass-morphism style"""
     
     def __init__(self, task_name: str, objective: str, completed: int, total: int, 
-                 errors: int, planning_dir: str, has_findings: bool, has_progress: bool):
+                 errors: int, planning_dir: str, has_findings: bool, has_progress: bool,
+                 open_tooltip: str = None):
         super().__init__(
             orientation=Gtk.Orientation.VERTICAL,
             spacing=0,
+            margin_top=8,
+            margin_bottom=8,
+            visible=False,
+            css_classes=["card"],
         )
-        self.add_css_class("card")
-        self.set_margin_top(8)
-        self.set_margin_bottom(8)
+        self.freeze_notify()
         
-        # Custom CSS for modern look
-        css_provider = Gtk.CssProvider()
-        css_provider.load_from_data(b"""
-            .planning-header {
-                background: linear-gradient(135deg, alpha(@accent_bg_color, 0.15), alpha(@accent_bg_color, 0.05));
-                border-radius: 12px 12px 0 0;
-                padding: 16px;
-            }
-            .planning-progress-ring {
-                font-size: 28px;
-                font-weight: 700;
-                color: @accent_color;
-            }
-            .planning-stat-box {
-                background: alpha(@card_bg_color, 0.5);
-                border-radius: 8px;
-                padding: 12px;
-                min-width: 80px;
-            }
-            .planning-stat-value {
-                font-size: 20px;
-                font-weight: 700;
-            }
-            .planning-stat-label {
-                font-size: 11px;
-                opacity: 0.7;
-            }
-            .planning-file-chip {
-                background: alpha(@success_bg_color, 0.15);
-                border-radius: 16px;
-                padding: 4px 12px;
-                font-size: 12px;
-            }
-            .planning-file-chip.missing {
-                background: alpha(@warning_bg_color, 0.15);
-            }
-            .error-badge {
-                background: alpha(@error_bg_color, 0.2);
-                color: @error_color;
-                border-radius: 12px;
-                padding: 2px 10px;
-                font-weight: 600;
-            }
-        """)
-        Gtk.StyleContext.add_provider_for_display(
-            self.get_display(),
-            css_provider,
-            Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-        )
+        _ensure_css(self.get_display(), "planning", _planning_css())
         
-        # Header with gradient
-        header = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=16)
-        header.add_css_class("planning-header")
+        # Header with gradient: the progress circle spans both rows on the
+        # left, the title and objective stack in the column next to it
+        header = Gtk.Grid(column_spacing=16, row_spacing=6, css_classes=["planning-header"])
         
-        # Left side - Progress circle
         progress_pct = int(completed / total * 100) if total > 0 else 0
         
-        progress_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
-        progress_box.set_valign(Gtk.Align.CENTER)
-        
         # Circular progress indicator using level bar styled as ring
         progress_circle = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=0)
         progress_circle.set_halign(Gtk.Align.CENTER)
+        progress_circle.set_valign(Gtk.Align.CENTER)
         
-        pct_label = Gtk.Label(label=f"{progress_pct}%")
-        pct_label.add_css_class("planning-progress-ring")
+        pct_label = _fixed_label(f"{progress_pct}%", ("planning-progress-ring",), xalign=0.5)
         progress_circle.append(pct_label)
         
-        progress_sublabel = Gtk.Label(label="complete")
-        progress_sublabel.add_css_class("caption")
-        progress_sublabel.add_css_class("dim-label")
+        progress_sublabel = _fixed_label("complete", ("caption", "dim-label"), xalign=0.5)
         progress_circle.append(progress_sublabel)
         
-        progress_box.append(progress_circle)
-        header.append(progress_box)
-        
-        # Center - Task info
-        info_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6, hexpand=True)
-        info_box.set_valign(Gtk.Align.CENTER)
+        header.attach(progress_circle, 0, 0, 1, 2)
         
         # Task name with icon
-        title_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
+        title_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8, hexpand=True)
         
-        plan_icon = Gtk.Image.new_from_icon_name("view-list-bullet-symbolic")
-        plan_icon.set_pixel_size(20)
-        plan_icon.add_css_class("accent")
+        plan_icon = _icon("view-list-bullet-symbolic", 20, ("accent",))
         title_row.append(plan_icon)
         
-        title_label = Gtk.Label(label=task_name, xalign=0)
-        title_label.add_css_class("title-3")
-        title_label.set_ellipsize(Pango.EllipsizeMode.END)
+        title_label = _fixed_label(task_name, ("title-3",))
         title_row.append(title_label)
         
         # Error badge if any
         if errors > 0:
-            error_badge = Gtk.Label(label=f"⚠ {errors}")
-            error_badge.add_css_class("error-badge")
-            error_badge.set_margin_start(8)
+            error_badge = _fixed_label(f"⚠ {errors}", ("error-badge",), xalign=0.5, margin_start=8)
             title_row.append(error_badge)
         
-        info_box.append(title_row)
-        
         # Objective
         if objective:
+            title_row.set_valign(Gtk.Align.END)
+            header.attach(title_row, 1, 0, 1, 1)
+            
             obj_label = Gtk.Label(
-                label=objective[:120] + ("..." if len(objective) > 120 else ""),
+                label=_ellipsize(objective, 120),
                 xalign=0,
                 wrap=True,
                 wrap_mode=Pango.WrapMode.WORD_CHAR,
                 lines=2,
+                css_classes=["dim-label"],
             )
             obj_label.set_ellipsize(Pango.EllipsizeMode.END)
-            obj_label.add_css_class("dim-label")
-            info_box.append(obj_label)
+            obj_label.set_valign(Gtk.Align.START)
+            header.attach(obj_label, 1, 1, 1, 1)
+        else:
+            title_row.set_valign(Gtk.Align.CENTER)
+            header.attach(title_row, 1, 0, 1, 2)
         
-        header.append(info_box)
         self.append(header)
         
         # Progress bar
-        progress_bar_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
-        progress_bar_box.set_margin_start(16)
-        progress_bar_box.set_margin_end(16)
-        progress_bar_box.set_margin_top(8)
+        progress_bar_box = Gtk.Box(
+            orientation=Gtk.Orientation.VERTICAL,
+            spacing=4,
+            margin_start=16,
+            margin_end=16,
+            margin_top=8,
+        )
         
         progress_bar = Gtk.ProgressBar()
         progress_bar.set_fraction(completed / total if total > 0 else 0)
@@ -230,19 +800,21 @@ class PlanningStatusWidget(Gtk.Box):
             progress_bar.add_css_class("success")
         progress_bar_box.append(progress_bar)
         
-        items_label = Gtk.Label(label=f"{completed} of {total} items completed", xalign=0)
-        items_label.add_css_class("caption")
-        items_label.add_css_class("dim-label")
+        items_label = _fixed_label(f"{completed} of {total} items completed", ("caption", "dim-label"))
         progress_bar_box.append(items_label)
         
         self.append(progress_bar_box)
         
         # Stats row
-        stats_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12, homogeneous=True)
-        stats_box.set_margin_start(16)
-        stats_box.set_margin_end(16)
-        stats_box.set_margin_top(16)
-        stats_box.set_margin_bottom(16)
+        stats_box = Gtk.Box(
+            orientation=Gtk.Orientation.HORIZONTAL,
+            spacing=12,
+            homogeneous=True,
+            margin_start=16,
+            margin_end=16,
+            margin_top=16,
+            margin_bottom=16,
+        )
         
         # Completed stat
         stats_box.append(self._create_stat_box(str(completed), "Completed", "emblem-default-symbolic"))
@@ -260,14 +832,16 @@ class PlanningStatusWidget(Gtk.Box):
         self.append(Gtk.Separator(orientation=Gtk.Orientation.HORIZONTAL))
         
         # Files row
-        files_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
-        files_box.set_margin_start(16)
-        files_box.set_margin_end(16)
-        files_box.set_margin_top(12)
-        files_box.set_margin_bottom(12)
-        
-        files_label = Gtk.Label(label="Files:")
-        files_label.add_css_class("dim-label")
+        files_box = Gtk.Box(
+            orientation=Gtk.Orientation.HORIZONTAL,
+            spacing=8,
+            margin_start=16,
+            margin_end=16,
+            margin_top=12,
+            margin_bottom=12,
+        )
+        
+        files_label = _fixed_label("Files:", ("dim-label",))
         files_box.append(files_label)
         
         # File chips
@@ -281,251 +855,252 @@ class PlanningStatusWidget(Gtk.Box):
         
         # Open folder button
         if planning_dir:
-            open_btn = Gtk.Button()
+            open_btn = Gtk.Button(css_classes=["flat", "circular"])
             open_btn.set_icon_name("folder-open-symbolic")
-            open_btn.add_css_class("flat")
-            open_btn.add_css_class("circular")
-            open_btn.set_tooltip_text(f"Open {planning_dir}")
-            open_btn.connect("clicked", lambda b: GLib.spawn_command_line_async(f"xdg-open '{planning_dir}'"))
+            open_btn.set_tooltip_text(open_tooltip or f"Open {planning_dir}")
+            open_btn.connect("clicked", lambda b: _open_folder(planning_dir))
             files_box.append(open_btn)
         
         self.append(files_box)
+        self.thaw_notify()
+        self.set_visible(True)
     
     def _create_stat_box(self, value: str, label: str, icon_name: str) -> Gtk.Box:
         """Create a stat display box"""
-        box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
-        box.add_css_class("planning-stat-box")
+        box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4, css_classes=["planning-stat-box"])
         box.set_halign(Gtk.Align.CENTER)
         
-        icon = Gtk.Image.new_from_icon_name(icon_name)
-        icon.set_pixel_size(16)
-        icon.add_css_class("dim-label")
+        icon = _icon(icon_name, 16, ("dim-label",))
         box.append(icon)
         
-        value_label = Gtk.Label(label=value)
-        value_label.add_css_class("planning-stat-value")
+        value_label = _fixed_label(value, ("planning-stat-value",), xalign=0.5)
         box.append(value_label)
         
-        label_widget = Gtk.Label(label=label)
-        label_widget.add_css_class("planning-stat-label")
+        label_widget = _fixed_label(label, ("planning-stat-label",), xalign=0.5)
         box.append(label_widget)
         
         return box
     
     def _create_file_chip(self, filename: str, exists: bool) -> Gtk.Box:
         """Create a file status chip"""
-        chip = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=4)
-        chip.add_css_class("planning-file-chip")
+        chip = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=4, css_classes=["planning-file-chip"])
         if not exists:
             chip.add_css_class("missing")
         
-        icon = Gtk.Image.new_from_icon_name("emblem-default-symbolic" if exists else "list-remove-symbolic")
-        icon.set_pixel_size(12)
+        icon = _icon("emblem-default-symbolic" if exists else "list-remove-symbolic", 12)
         chip.append(icon)
         
-        label = Gtk.Label(label=filename)
+        label = _fixed_label(filename)
         chip.append(label)
         
         return chip
 
 
+class TodoItem(GObject.Object):
+    """List model item for a todo, or for a phase header when is_header is set"""
+    
+    text = GObject.Property(type=str, default="")
+    completed = GObject.Property(type=bool, default=False)
+    phase = GObject.Property(type=str, default="")
+    is_header = GObject.Property(type=bool, default=False)
+
+
+class TodoRows(GObject.Object, Gio.ListModel):
+    """Read-only list model over parallel row arrays. The TodoItem of a row
+    is only created once the list view binds it, so a long plan costs
+    three arrays rather than one GObject per todo."""
+    
+    def __init__(self, phases: dict, on_item=None):
+        super().__init__()
+        self._texts = []
+        self._done = bytearray()
+        self._headers = bytearray()
+        self._phases = []
+        self._items = {}
+        self._on_item = on_item
+        show_phases = len(phases) > 1
+        for phase, phase_todos in phases.items():
+            if show_phases and phase:
+                self._texts.append(phase)
+                self._done.append(0)
+                self._headers.append(1)
+                self._phases.append(phase)
+            for todo in phase_todos:
+                self._texts.append(todo.text)
+                self._done.append(todo.completed)
+                self._headers.append(0)
+                self._phases.append(phase or "")
+    
+    def do_get_item_type(self):
+        return TodoItem.__gtype__
+    
+    def do_get_n_items(self):
+        return len(self._texts)
+    
+    def do_get_item(self, position):
+        if position >= len(self._texts):
+            return None
+        item = self._items.get(position)
+        if item is None:
+            if self._headers[position]:
+                item = TodoItem(text=self._texts[position], is_header=True)
+            else:
+                item = TodoItem(
+                    text=self._texts[position],
+                    completed=bool(self._done[position]),
+                    phase=self._phases[position],
+                )
+                if self._on_item:
+                    self._on_item(item)
+            # Kept so a toggled checkbox survives its row being recycled
+            self._items[position] = item
+        return item
+
+
 class TodoListWidget(Gtk.Box):
     """Modern todo list widget with interactive checkboxes"""
     
-    def __init__(self, todos: list, on_toggle_callback=None, title: str = "Tasks"):
-        super().__init__(orientation=Gtk.Orientation.VERTICAL, spacing=0)
-        self.add_css_class("card")
+    def __init__(self, todos: list, on_toggle_callback=None, title: str = "Tasks", stats: TodoStats = None):
+        super().__init__(orientation=Gtk.Orientation.VERTICAL, spacing=0, margin_top=8, margin_bottom=8,
+                         visible=False, css_classes=["card"])
+        self.freeze_notify()
         self.set_size_request(-1, 200)
-        self.set_margin_top(8)
-        self.set_margin_bottom(8)
         
         self.on_toggle = on_toggle_callback
         
-        # Custom CSS
-        css_provider = Gtk.CssProvider()
-        css_provider.load_from_data(b"""
-            .todo-header {
-                padding: 12px 16px;
-                background: alpha(@accent_bg_color, 0.08);
-            }
-            .todo-item {
-                padding: 8px 16px;
-                border-bottom: 1px solid alpha(@borders, 0.3);
-            }
-            .todo-item:last-child {
-                border-bottom: none;
-            }
-            .todo-completed .todo-text {
-                text-decoration: line-through;
-                opacity: 0.5;
-            }
-            .phase-header {
-                background: alpha(@view_bg_color, 0.5);
-                padding: 6px 16px;
-                font-weight: 600;
-                font-size: 12px;
-            }
-        """)
-        Gtk.StyleContext.add_provider_for_display(
-            self.get_display(),
-            css_provider,
-            Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-        )
+        _ensure_css(self.get_display(), "planning", _planning_css())
         
-        completed = sum(1 for t in todos if t.get('completed', False))
-        total = len(todos)
+        if stats is None:
+            stats = _todo_stats(todos)
+        completed = stats.completed
+        total = stats.total
         
         # Header
-        header = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
-        header.add_css_class("todo-header")
+        header = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12, css_classes=["todo-header"])
         
-        icon = Gtk.Image.new_from_icon_name("checkbox-checked-symbolic")
-        icon.set_pixel_size(18)
-        icon.add_css_class("accent")
+        icon = _icon("checkbox-checked-symbolic", 18, ("accent",))
         header.append(icon)
         
-        title_label = Gtk.Label(label=title, xalign=0, hexpand=True)
-        title_label.add_css_class("heading")
+        title_label = _fixed_label(title, ("heading",), hexpand=True)
         header.append(title_label)
         
-        count_label = Gtk.Label(label=f"{completed}/{total}")
-        count_label.add_css_class("caption")
-        count_label.add_css_class("dim-label")
+        count_label = _fixed_label(f"{completed}/{total}", ("caption", "dim-label"), xalign=0.5)
         header.append(count_label)
         
         self.append(header)
         
-        # Group by phase
-        phases = {}
-        for todo in todos:
-            phase = todo.get('phase', 'Other')
-            if phase not in phases:
-                phases[phase] = []
-            phases[phase].append(todo)
+        # Flatten into one model; phase headers are rows with is_header set
+        store = TodoRows(
+            stats.by_phase,
+            lambda item: item.connect("notify::completed", self._on_item_completed),
+        )
         
-        # Create todo items
-        list_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=0)
+        # Rows are created for the visible items only and recycled on scroll
+        factory = Gtk.SignalListItemFactory()
+        factory.connect("setup", self._on_setup_row)
+        factory.connect("bind", self._on_bind_row)
         
-        for phase, phase_todos in phases.items():
-            if len(phases) > 1 and phase:
-                # Phase header
-                phase_header = Gtk.Label(label=phase, xalign=0)
-                phase_header.add_css_class("phase-header")
-                list_box.append(phase_header)
-            
-            for todo in phase_todos:
-                row = self._create_todo_row(todo)
-                list_box.append(row)
-        
-        # Scrolled container for long lists
-        if len(todos) > 5:
-            scrolled = Gtk.ScrolledWindow()
-            scrolled.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
-            scrolled.set_max_content_height(300)
-            scrolled.set_propagate_natural_height(True)
-            scrolled.set_child(list_box)
-            self.append(scrolled)
-        else:
-            self.append(list_box)
+        list_view = Gtk.ListView(model=Gtk.NoSelection.new(store), factory=factory, css_classes=["todo-list"])
+        
+        scrolled = Gtk.ScrolledWindow()
+        scrolled.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
+        scrolled.set_max_content_height(300)
+        scrolled.set_propagate_natural_height(True)
+        scrolled.set_child(list_view)
+        self.append(scrolled)
+        self.thaw_notify()
+        self.set_visible(True)
     
-    def _create_todo_row(self, todo: dict) -> Gtk.Box:
-        """Create a single todo item row"""
-        row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
-        row.add_css_class("todo-item")
-        if todo.get('completed'):
-            row.add_css_class("todo-completed")
+    def _on_setup_row(self, factory, list_item):
+        """Build the reusable row template: checkbox | wrapping label"""
+        row = Gtk.Grid(column_spacing=12)
         
-        # Checkbox
         check = Gtk.CheckButton()
-        check.set_active(todo.get('completed', False))
         check.set_valign(Gtk.Align.CENTER)
-        if self.on_toggle:
-            check.connect("toggled", lambda btn, txt=todo.get('text', ''): self.on_toggle(txt, btn.get_active()))
-        row.append(check)
+        check.connect("toggled", self._on_check_toggled, list_item)
+        row.attach(check, 0, 0, 1, 1)
         
-        # Text
         text_label = Gtk.Label(
-            label=todo.get('text', ''),
             xalign=0,
             hexpand=True,
             wrap=True,
             wrap_mode=Pango.WrapMode.WORD_CHAR,
         )
-        text_label.add_css_class("todo-text")
-        row.append(text_label)
+        row.attach(text_label, 1, 0, 1, 1)
         
-        return row
+        list_item.set_child(row)
+    
+    def _on_bind_row(self, factory, list_item):
+        """Fill a recycled row from its item"""
+        item = list_item.get_item()
+        row = list_item.get_child()
+        check = row.get_child_at(0, 0)
+        text_label = row.get_child_at(1, 0)
+        
+        text_label.set_label(item.text)
+        check.set_visible(not item.is_header)
+        if item.is_header:
+            row.set_css_classes(["phase-header"])
+            text_label.set_css_classes([])
+        else:
+            check.set_active(item.completed)
+            row.set_css_classes(["todo-item", "todo-completed"] if item.completed else ["todo-item"])
+            text_label.set_css_classes(["todo-text"])
+    
+    def _on_check_toggled(self, check, list_item):
+        item = list_item.get_item()
+        if item is None or item.is_header or item.completed == check.get_active():
+            return
+        item.completed = check.get_active()
+        row = list_item.get_child()
+        if item.completed:
+            row.add_css_class("todo-completed")
+        else:
+            row.remove_css_class("todo-completed")
+    
+    def _on_item_completed(self, item, pspec):
+        if self.on_toggle:
+            self.on_toggle(item.text, item.completed)
 
 
 class FindingWidget(Gtk.Box):
     """Widget for displaying a single finding"""
     
     def __init__(self, title: str, content: str, category: str = None, timestamp: str = None):
-        super().__init__(orientation=Gtk.Orientation.VERTICAL, spacing=0)
-        self.add_css_class("card")
-        self.set_margin_top(8)
-        self.set_margin_bottom(8)
+        super().__init__(orientation=Gtk.Orientation.VERTICAL, spacing=0, margin_top=8, margin_bottom=8,
+                         visible=False, css_classes=["card"])
+        self.freeze_notify()
         
-        # CSS
-        css_provider = Gtk.CssProvider()
-        css_provider.load_from_data(b"""
-            .finding-header {
-                background: linear-gradient(90deg, alpha(@blue_3, 0.12), transparent);
-                padding: 12px 16px;
-                border-radius: 12px 12px 0 0;
-            }
-            .finding-content {
-                padding: 12px 16px;
-            }
-            .finding-category {
-                background: alpha(@accent_bg_color, 0.15);
-                border-radius: 4px;
-                padding: 2px 8px;
-                font-size: 11px;
-            }
-        """)
-        Gtk.StyleContext.add_provider_for_display(
-            self.get_display(),
-            css_provider,
-            Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-        )
+        _ensure_css(self.get_display(), "planning", _planning_css())
         
         # Header
-        header = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
-        header.add_css_class("finding-header")
+        header = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12, css_classes=["finding-header"])
         
-        icon = Gtk.Image.new_from_icon_name("starred-symbolic")
-        icon.set_pixel_size(18)
-        icon.add_css_class("warning")
+        icon = _icon("starred-symbolic", 18, ("warning",))
         header.append(icon)
         
-        title_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=2, hexpand=True)
+        title_box = Gtk.Grid(row_spacing=2, hexpand=True)
         
-        title_label = Gtk.Label(label=title, xalign=0)
-        title_label.add_css_class("heading")
-        title_box.append(title_label)
+        title_label = _fixed_label(title, ("heading",))
+        title_box.attach(title_label, 0, 0, 1, 1)
         
         if timestamp:
-            time_label = Gtk.Label(label=timestamp, xalign=0)
-            time_label.add_css_class("caption")
-            time_label.add_css_class("dim-label")
-            title_box.append(time_label)
+            time_label = _fixed_label(timestamp, ("caption", "dim-label"))
+            title_box.attach(time_label, 0, 1, 1, 1)
         
         header.append(title_box)
         
         if category:
-            cat_label = Gtk.Label(label=category)
-            cat_label.add_css_class("finding-category")
+            cat_label = _fixed_label(category, ("finding-category",), xalign=0.5)
             header.append(cat_label)
         
         self.append(header)
         
         # Content
-        content_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
-        content_box.add_css_class("finding-content")
+        content_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, css_classes=["finding-content"])
         
         content_label = Gtk.Label(
-            label=content[:500] + ("..." if len(content) > 500 else ""),
+            label=_ellipsize(content, 500),
             xalign=0,
             wrap=True,
             wrap_mode=Pango.WrapMode.WORD_CHAR,
@@ -534,68 +1109,44 @@ class FindingWidget(Gtk.Box):
         content_box.append(content_label)
         
         self.append(content_box)
+        self.thaw_notify()
+        self.set_visible(True)
 
 
 class ErrorLogWidget(Gtk.Box):
     """Widget for displaying logged errors"""
     
     def __init__(self, error: str, context: str = "", timestamp: str = None):
-        super().__init__(orientation=Gtk.Orientation.VERTICAL, spacing=0)
-        self.add_css_class("card")
-        self.set_margin_top(8)
-        self.set_margin_bottom(8)
+        super().__init__(orientation=Gtk.Orientation.VERTICAL, spacing=0, margin_top=8, margin_bottom=8,
+                         visible=False, css_classes=["card"])
+        self.freeze_notify()
         
-        css_provider = Gtk.CssProvider()
-        css_provider.load_from_data(b"""
-            .error-widget-header {
-                background: linear-gradient(90deg, alpha(@error_bg_color, 0.2), transparent);
-                padding: 12px 16px;
-                border-radius: 12px 12px 0 0;
-            }
-            .error-content {
-                padding: 12px 16px;
-                background: alpha(@error_bg_color, 0.05);
-            }
-            .error-reminder {
-                background: alpha(@warning_bg_color, 0.1);
-                border-radius: 8px;
-                padding: 8px 12px;
-                margin: 8px 16px 12px 16px;
-            }
-        """)
-        Gtk.StyleContext.add_provider_for_display(
-            self.get_display(),
-            css_provider,
-            Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-        )
+        _ensure_css(self.get_display(), "planning", _planning_css())
         
         # Header
-        header = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
-        header.add_css_class("error-widget-header")
+        header = Gtk.Box(
+            orientation=Gtk.Orientation.HORIZONTAL,
+            spacing=12,
+            css_classes=["error-widget-header"],
+        )
         
-        icon = Gtk.Image.new_from_icon_name("dialog-warning-symbolic")
-        icon.set_pixel_size(20)
-        icon.add_css_class("error")
+        icon = _icon("dialog-warning-symbolic", 20, ("error",))
         header.append(icon)
         
-        title_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=2, hexpand=True)
+        title_box = Gtk.Grid(row_spacing=2, hexpand=True)
         
-        title_label = Gtk.Label(label="Error Logged", xalign=0)
-        title_label.add_css_class("heading")
-        title_box.append(title_label)
+        title_label = _fixed_label("Error Logged", ("heading",))
+        title_box.attach(title_label, 0, 0, 1, 1)
         
         if timestamp:
-            time_label = Gtk.Label(label=timestamp, xalign=0)
-            time_label.add_css_class("caption")
-            time_label.add_css_class("dim-label")
-            title_box.append(time_label)
+            time_label = _fixed_label(timestamp, ("caption", "dim-label"))
+            title_box.attach(time_label, 0, 1, 1, 1)
         
         header.append(title_box)
         self.append(header)
         
         # Error content
-        content_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=8)
-        content_box.add_css_class("error-content")
+        content_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=8, css_classes=["error-content"])
         
         error_label = Gtk.Label(
             label=error,
@@ -603,111 +1154,73 @@ class ErrorLogWidget(Gtk.Box):
             wrap=True,
             wrap_mode=Pango.WrapMode.WORD_CHAR,
             selectable=True,
+            css_classes=["error"],
         )
-        error_label.add_css_class("error")
         content_box.append(error_label)
         
         if context:
-            ctx_label = Gtk.Label(label=f"Context: {context}", xalign=0, wrap=True)
-            ctx_label.add_css_class("dim-label")
+            ctx_label = Gtk.Label(label=f"Context: {context}", xalign=0, wrap=True, css_classes=["dim-label"])
             content_box.append(ctx_label)
         
         self.append(content_box)
         
         # Reminder
-        reminder = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
-        reminder.add_css_class("error-reminder")
+        reminder = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8, css_classes=["error-reminder"])
         
-        remind_icon = Gtk.Image.new_from_icon_name("dialog-information-symbolic")
-        remind_icon.set_pixel_size(16)
+        remind_icon = _icon("dialog-information-symbolic", 16)
         reminder.append(remind_icon)
         
         remind_label = Gtk.Label(
             label="Never repeat failures — track attempts, mutate approach!",
             xalign=0,
             wrap=True,
+            css_classes=["caption"],
         )
-        remind_label.add_css_class("caption")
         reminder.append(remind_label)
         
         self.append(reminder)
+        self.thaw_notify()
+        self.set_visible(True)
 
 
 class PlanCreatedWidget(Gtk.Box):
     """Celebratory widget shown when a plan is created"""
     
     def __init__(self, task_name: str, objective: str, planning_dir: str):
-        super().__init__(orientation=Gtk.Orientation.VERTICAL, spacing=0)
-        self.add_css_class("card")
-        self.set_margin_top(8)
-        self.set_margin_bottom(8)
+        super().__init__(orientation=Gtk.Orientation.VERTICAL, spacing=0, margin_top=8, margin_bottom=8,
+                         visible=False, css_classes=["card"])
+        self.freeze_notify()
         
-        css_provider = Gtk.CssProvider()
-        css_provider.load_from_data(b"""
-            .plan-created-header {
-                background: linear-gradient(135deg, alpha(@success_bg_color, 0.2), alpha(@accent_bg_color, 0.1));
-                padding: 20px;
-                border-radius: 12px 12px 0 0;
-            }
-            .plan-created-files {
-                padding: 16px;
-            }
-            .file-row {
-                padding: 8px 12px;
-                border-radius: 8px;
-                background: alpha(@card_bg_color, 0.5);
-                margin-bottom: 8px;
-            }
-            .plan-tip {
-                background: alpha(@accent_bg_color, 0.1);
-                border-radius: 8px;
-                padding: 12px;
-                margin: 0 16px 16px 16px;
-            }
-        """)
-        Gtk.StyleContext.add_provider_for_display(
-            self.get_display(),
-            css_provider,
-            Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-        )
+        _ensure_css(self.get_display(), "planning", _planning_css())
         
         # Header
-        header = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=8)
-        header.add_css_class("plan-created-header")
+        header = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=8, css_classes=["plan-created-header"])
         header.set_halign(Gtk.Align.CENTER)
         
-        check_icon = Gtk.Image.new_from_icon_name("emblem-default-symbolic")
-        check_icon.set_pixel_size(48)
-        check_icon.add_css_class("success")
+        check_icon = _icon("emblem-default-symbolic", 48, ("success",))
         header.append(check_icon)
         
-        success_label = Gtk.Label(label="Plan Created!")
-        success_label.add_css_class("title-1")
+        success_label = _fixed_label("Plan Created!", ("title-1",), xalign=0.5)
         header.append(success_label)
         
-        task_label = Gtk.Label(label=task_name)
-        task_label.add_css_class("title-3")
-        task_label.add_css_class("accent")
+        task_label = _fixed_label(task_name, ("title-3", "accent"), xalign=0.5)
         header.append(task_label)
         
         if objective:
             obj_label = Gtk.Label(
-                label=objective[:100] + ("..." if len(objective) > 100 else ""),
+                label=_ellipsize(objective, 100),
                 wrap=True,
                 justify=Gtk.Justification.CENTER,
+                css_classes=["dim-label"],
             )
-            obj_label.add_css_class("dim-label")
             header.append(obj_label)
         
         self.append(header)
         
         # Files created
-        files_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=0)
-        files_box.add_css_class("plan-created-files")
+        files_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=0, css_classes=["plan-created-files"])
         
-        files_label = Gtk.Label(label="Files Created:", xalign=0)
-        files_label.add_css_class("heading")
-        files_label.set_margin_bottom(12)
+        files_label = _fixed_label("Files Created:", ("heading",), margin_bottom=12)
         files_box.append(files_label)
         
         files_info = [
@@ -717,23 +1230,17 @@ class PlanCreatedWidget(Gtk.Box):
         ]
         
         for icon_name, filename, description in files_info:
-            row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
-            row.add_css_class("file-row")
+            row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12, css_classes=["file-row"])
             
-            icon = Gtk.Image.new_from_icon_name(icon_name)
-            icon.set_pixel_size(20)
-            icon.add_css_class("accent")
+            icon = _icon(icon_name, 20, ("accent",))
             row.append(icon)
             
             text_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=2, hexpand=True)
             
-            name_label = Gtk.Label(label=filename, xalign=0)
-            name_label.add_css_class("heading")
+            name_label = _fixed_label(filename, ("heading",))
             text_box.append(name_label)
             
-            desc_label = Gtk.Label(label=description, xalign=0)
-            desc_label.add_css_class("caption")
-            desc_label.add_css_class("dim-label")
+            desc_label = _fixed_label(description, ("caption", "dim-label"))
             text_box.append(desc_label)
             
             row.append(text_box)
@@ -742,65 +1249,59 @@ class PlanCreatedWidget(Gtk.Box):
         self.append(files_box)
         
         # Tip
-        tip_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
-        tip_box.add_css_class("plan-tip")
+        tip_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8, css_classes=["plan-tip"])
         
-        tip_icon = Gtk.Image.new_from_icon_name("dialog-information-symbolic")
-        tip_icon.set_pixel_size(16)
-        tip_icon.add_css_class("accent")
+        tip_icon = _icon("dialog-information-symbolic", 16, ("accent",))
         tip_box.append(tip_icon)
         
         tip_label = Gtk.Label(
             label="💡 Remember the 2-Action Rule: Save findings after every 2 view/browser operations!",
             xalign=0,
             wrap=True,
+            css_classes=["caption"],
         )
-        tip_label.add_css_class("caption")
         tip_box.append(tip_label)
         
         self.append(tip_box)
+        self.thaw_notify()
+        self.set_visible(True)
 
 
 class EmptyPlanWidget(Gtk.Box):
     """Widget shown when no plan exists"""
     
     def __init__(self):
-        super().__init__(orientation=Gtk.Orientation.VERTICAL, spacing=16)
-        self.add_css_class("card")
-        self.set_margin_top(8)
-        self.set_margin_bottom(8)
-        self.set_halign(Gtk.Align.CENTER)
-        
-        self.set_margin_start(24)
-        self.set_margin_end(24)
-        self.set_margin_top(24)
-        self.set_margin_bottom(24)
-        
-        icon = Gtk.Image.new_from_icon_name("document-new-symbolic")
-        icon.set_pixel_size(64)
-        icon.add_css_class("dim-label")
+        super().__init__(
+            orientation=Gtk.Orientation.VERTICAL,
+            spacing=16,
+            halign=Gtk.Align.CENTER,
+            margin_top=24,
+            margin_bottom=24,
+            margin_start=24,
+            margin_end=24,
+            visible=False,
+            css_classes=["card"],
+        )
+        self.freeze_notify()
+        
+        icon = _icon("document-new-symbolic", 64, ("dim-label",))
         self.append(icon)
         
-        title = Gtk.Label(label="No Active Plan")
-        title.add_css_class("title-2")
-        title.add_css_class("dim-label")
+        title = _fixed_label("No Active Plan", ("title-2", "dim-label"), xalign=0.5)
         self.append(title)
         
         hint = Gtk.Label(
             label="Use create_plan to start a new planning session",
             wrap=True,
             justify=Gtk.Justification.CENTER,
+            css_classes=["caption", "dim-label"],
         )
-        hint.add_css_class("caption")
-        hint.add_css_class("dim-label")
         self.append(hint)
         
         # Core principle box
-        principle_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
-        principle_box.set_margin_top(8)
+        principle_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4, margin_top=8)
         
-        principle_label = Gtk.Label(label="Core Principle:", xalign=0)
-        principle_label.add_css_class("heading")
+        principle_label = _fixed_label("Core Principle:", ("heading",))
         principle_box.append(principle_label)
         
         lines = [
@@ -809,139 +1310,364 @@ class EmptyPlanWidget(Gtk.Box):
             "→ Anything important goes to disk"
         ]
         for line in lines:
-            line_label = Gtk.Label(label=line, xalign=0)
-            line_label.add_css_class("caption")
+            line_label = _fixed_label(line, ("caption",))
             principle_box.append(line_label)
         
         self.append(principle_box)
+        self.thaw_notify()
+        self.set_visible(True)
+
+
+# Static scaffold of the mini app, parsed by GtkBuilder's C code rather
+# than assembled widget by widget. A single-file extension has no place
+# to ship a .ui resource, so the XML lives here.
+_MINI_APP_UI = """<?xml version="1.0" encoding="UTF-8"?>
+<interface>
+  <object class="GtkBox" id="header">
+    <property name="spacing">12</property>
+    <style><class name="planning-mini-header"/></style>
+    <child>
+      <object class="GtkImage">
+        <property name="icon-name">view-list-bullet-symbolic</property>
+        <property name="pixel-size">24</property>
+        <style><class name="accent"/></style>
+      </object>
+    </child>
+    <child>
+      <object class="GtkBox">
+        <property name="orientation">vertical</property>
+        <property name="spacing">2</property>
+        <property name="hexpand">true</property>
+        <child>
+          <object class="GtkLabel">
+            <property name="label">Planning Session</property>
+            <property name="xalign">0</property>
+            <style><class name="title-3"/></style>
+          </object>
+        </child>
+        <child>
+          <object class="GtkLabel" id="subtitle_label">
+            <property name="label">No active plan</property>
+            <property name="xalign">0</property>
+            <style><class name="caption"/><class name="dim-label"/></style>
+          </object>
+        </child>
+      </object>
+    </child>
+    <child>
+      <object class="GtkBox" id="status_box">
+        <property name="spacing">6</property>
+        <style><class name="planning-mini-status"/></style>
+        <child>
+          <object class="GtkLabel" id="status_label">
+            <property name="label">Idle</property>
+          </object>
+        </child>
+      </object>
+    </child>
+    <child>
+      <object class="GtkButton" id="refresh_btn">
+        <property name="icon-name">view-refresh-symbolic</property>
+        <property name="tooltip-text">Refresh planning status</property>
+        <style><class name="flat"/><class name="circular"/></style>
+      </object>
+    </child>
+    <child>
+      <object class="GtkButton" id="open_btn">
+        <property name="icon-name">folder-open-symbolic</property>
+        <property name="tooltip-text">Open planning directory</property>
+        <style><class name="flat"/><class name="circular"/></style>
+      </object>
+    </child>
+  </object>
+  <object class="GtkScrolledWindow" id="scroller">
+    <property name="hscrollbar-policy">never</property>
+    <property name="vscrollbar-policy">automatic</property>
+    <property name="vexpand">true</property>
+    <child>
+      <object class="GtkBox" id="content_box">
+        <property name="orientation">vertical</property>
+        <property name="vexpand">true</property>
+        <style><class name="planning-mini-content"/></style>
+      </object>
+    </child>
+  </object>
+</interface>
+"""
 
 
 class PlanningMiniApp(Gtk.Box):
     """Mini App widget showing real-time planning status"""
     
+    # Directory monitor events that can change what the panel shows
+    _MONITOR_EVENTS = frozenset((
+        Gio.FileMonitorEvent.CHANGES_DONE_HINT,
+        Gio.FileMonitorEvent.CREATED,
+        Gio.FileMonitorEvent.DELETED,
+        Gio.FileMonitorEvent.RENAMED,
+        Gio.FileMonitorEvent.MOVED_IN,
+        Gio.FileMonitorEvent.MOVED_OUT,
+    ))
+    
+    # Safety net for missed events and planning directory changes
+    _FALLBACK_POLL_SECONDS = 30
+    
+    # Window in which monitor events and write callbacks share one refresh;
+    # create_plan alone produces a burst of events over three files
+    _REFRESH_DELAY_MS = 100
+    
     def __init__(self, extension):
-        super().__init__(orientation=Gtk.Orientation.VERTICAL, spacing=0)
+        super().__init__(orientation=Gtk.Orientation.VERTICAL, spacing=0, visible=False)
+        self.freeze_notify()
         self.extension = extension
         self._poll_source_id = None
-        self._last_data_hash = None
-        
-        # Custom CSS
-        css_provider = Gtk.CssProvider()
-        css_provider.load_from_data(b"""
-            .planning-mini-header {
-                background: linear-gradient(135deg, alpha(@accent_bg_color, 0.15), alpha(@blue_3, 0.08));
-                padding: 16px;
-            }
-            .planning-mini-content {
-                background: alpha(@view_bg_color, 0.3);
-            }
-            .planning-mini-status {
-                background: alpha(@success_bg_color, 0.15);
-                border-radius: 12px;
-                padding: 4px 12px;
-                font-size: 12px;
-            }
-            .planning-mini-status.active {
-                background: alpha(@warning_bg_color, 0.2);
-            }
-            .file-content-box {
-                background: alpha(@card_bg_color, 0.5);
-                border-radius: 8px;
-                padding: 12px;
-                margin: 8px;
-            }
-            .file-content-text {
-                font-family: monospace;
-                font-size: 12px;
-            }
-        """)
-        Gtk.StyleContext.add_provider_for_display(
-            self.get_display(),
-            css_provider,
-            Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-        )
+        self._monitor = None
+        self._monitor_dir = None
+        self._pending_refresh_id = 0
+        # Set when a refresh was skipped while unmapped; applied on "map"
+        self._dirty = True
+        self._load_thread = None
+        self._reload_requested = False
+        self._last_stat_key = None
+        self._applied = None
+        self._last_obj_label = None
+        
+        _ensure_css(self.get_display(), "planning", _planning_css())
+        
+        # The header and scroller come from the scaffold; fill the content.
+        # A plain builder rather than a template class: the module may be
+        # executed again on reload, and a fixed GType name cannot be
+        # registered twice.
+        builder = Gtk.Builder.new_from_string(_MINI_APP_UI, -1)
+        self.append(builder.get_object("header"))
+        self.append(builder.get_object("scroller"))
+        self.subtitle_label = builder.get_object("subtitle_label")
+        self.status_box = builder.get_object("status_box")
+        self.status_label = builder.get_object("status_label")
+        self.open_btn = builder.get_object("open_btn")
+        self.content_box = builder.get_object("content_box")
+        builder.get_object("refresh_btn").connect("clicked", self._on_refresh_clicked)
+        self.open_btn.connect("clicked", self._on_open_folder)
         
-        # Header
-        header = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
-        header.add_css_class("planning-mini-header")
+        self._build_empty_state()
+        self._build_plan_view()
         
-        icon = Gtk.Image.new_from_icon_name("view-list-bullet-symbolic")
-        icon.set_pixel_size(24)
-        icon.add_css_class("accent")
-        header.append(icon)
+        # Watch the planning directory while the widget is realized
+        self.connect("realize", self._on_realize)
+        self.connect("unrealize", self._on_unrealize)
+        self.connect("map", self._on_map)
+        self.thaw_notify()
+        self.set_visible(True)
+    
+    def _build_empty_state(self):
+        """Build the placeholder shown while no plan exists"""
+        self._empty_box = Gtk.Box(
+            orientation=Gtk.Orientation.VERTICAL,
+            spacing=12,
+            halign=Gtk.Align.CENTER,
+            valign=Gtk.Align.CENTER,
+            vexpand=True,
+            margin_top=48,
+            margin_bottom=48,
+            visible=False,
+        )
         
-        title_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=2, hexpand=True)
+        empty_icon = _icon("document-new-symbolic", 48, ("dim-label",))
+        self._empty_box.append(empty_icon)
         
-        title_label = Gtk.Label(label="Planning Session", xalign=0)
-        title_label.add_css_class("title-3")
-        title_box.append(title_label)
+        empty_label = Gtk.Label(label="No Active Plan", css_classes=["title-4", "dim-label"])
+        self._empty_box.append(empty_label)
         
-        self.subtitle_label = Gtk.Label(label="No active plan", xalign=0)
-        self.subtitle_label.add_css_class("caption")
-        self.subtitle_label.add_css_class("dim-label")
-        title_box.append(self.subtitle_label)
+        empty_hint = Gtk.Label(
+            label="Use create_plan tool to start planning",
+            wrap=True,
+            justify=Gtk.Justification.CENTER,
+            css_classes=["caption", "dim-label"],
+        )
+        self._empty_box.append(empty_hint)
         
-        header.append(title_box)
+        self.content_box.append(self._empty_box)
+    
+    def _build_plan_view(self):
+        """Build the plan sections once; apply() only updates their contents"""
+        self._plan_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=0, visible=False)
         
-        # Status indicator
-        self.status_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
-        self.status_box.add_css_class("planning-mini-status")
+        # Progress section
+        progress_box = Gtk.Box(
+            orientation=Gtk.Orientation.VERTICAL,
+            spacing=8,
+            margin_start=16,
+            margin_end=16,
+            margin_top=16,
+        )
         
-        self.status_label = Gtk.Label(label="Idle")
-        self.status_box.append(self.status_label)
+        progress_header = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
+        progress_title = Gtk.Label(label="Progress", xalign=0, hexpand=True, css_classes=["heading"])
+        progress_header.append(progress_title)
         
-        header.append(self.status_box)
+        self._progress_label = Gtk.Label(css_classes=["caption"])
+        progress_header.append(self._progress_label)
         
-        # Refresh button
-        refresh_btn = Gtk.Button()
-        refresh_btn.set_icon_name("view-refresh-symbolic")
-        refresh_btn.add_css_class("flat")
-        refresh_btn.add_css_class("circular")
-        refresh_btn.set_tooltip_text("Refresh planning status")
-        refresh_btn.connect("clicked", lambda b: self._update_content())
-        header.append(refresh_btn)
+        progress_box.append(progress_header)
         
-        # Open folder button
-        self.open_btn = Gtk.Button()
-        self.open_btn.set_icon_name("folder-open-symbolic")
-        self.open_btn.add_css_class("flat")
-        self.open_btn.add_css_class("circular")
-        self.open_btn.set_tooltip_text("Open planning directory")
-        self.open_btn.connect("clicked", self._on_open_folder)
-        header.append(self.open_btn)
+        self._progress_bar = Gtk.ProgressBar()
+        progress_box.append(self._progress_bar)
         
-        self.append(header)
+        self._error_label = Gtk.Label(xalign=0, visible=False, css_classes=["error", "caption"])
+        progress_box.append(self._error_label)
+        
+        self._plan_box.append(progress_box)
+        
+        # Objective section
+        self._obj_box = Gtk.Box(
+            orientation=Gtk.Orientation.VERTICAL,
+            spacing=4,
+            visible=False,
+            css_classes=["file-content-box"],
+        )
+        
+        obj_title = Gtk.Label(label="Objective", xalign=0, css_classes=["heading"])
+        self._obj_box.append(obj_title)
+        
+        self._obj_text = Gtk.Label(
+            xalign=0,
+            wrap=True,
+            wrap_mode=Pango.WrapMode.WORD_CHAR,
+            css_classes=["dim-label"],
+        )
+        self._obj_box.append(self._obj_text)
+        
+        self._plan_box.append(self._obj_box)
+        
+        # Todos section; a virtualized list whose items are kept by key
+        self._todos_box = Gtk.Box(
+            orientation=Gtk.Orientation.VERTICAL,
+            spacing=4,
+            visible=False,
+            css_classes=["file-content-box"],
+        )
+        
+        todos_title = Gtk.Label(label="Tasks", xalign=0, css_classes=["heading"])
+        self._todos_box.append(todos_title)
+        
+        self._todo_store = Gio.ListStore.new(TodoItem)
+        self._todo_items = {}
         
-        # Content area with scrolling
-        self.content_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=0)
-        self.content_box.add_css_class("planning-mini-content")
-        self.content_box.set_vexpand(True)
+        factory = Gtk.SignalListItemFactory()
+        factory.connect("setup", self._on_setup_todo_row)
+        factory.connect("bind", self._on_bind_todo_row)
         
-        scrolled = Gtk.ScrolledWindow(
+        todo_view = Gtk.ListView(
+            model=Gtk.NoSelection.new(self._todo_store),
+            factory=factory,
+            css_classes=["todo-list"],
+        )
+        
+        todo_scrolled = Gtk.ScrolledWindow(
             hscrollbar_policy=Gtk.PolicyType.NEVER,
             vscrollbar_policy=Gtk.PolicyType.AUTOMATIC,
-            vexpand=True,
+            max_content_height=400,
+            propagate_natural_height=True,
+        )
+        todo_scrolled.set_child(todo_view)
+        self._todos_box.append(todo_scrolled)
+        
+        self._plan_box.append(self._todos_box)
+        
+        # Files status
+        files_box = Gtk.Box(
+            orientation=Gtk.Orientation.HORIZONTAL,
+            spacing=8,
+            margin_start=16,
+            margin_end=16,
+            margin_top=8,
+            margin_bottom=16,
         )
-        scrolled.set_child(self.content_box)
-        self.append(scrolled)
         
-        # Start polling when widget is realized
-        self.connect("realize", self._on_realize)
-        self.connect("unrealize", self._on_unrealize)
+        files_label = Gtk.Label(label="Files:", xalign=0, css_classes=["caption", "dim-label"])
+        files_box.append(files_label)
+        
+        self._file_chips = {}
+        for fname in PLANNING_FILES:
+            chip = Gtk.Box(
+                orientation=Gtk.Orientation.HORIZONTAL,
+                spacing=4,
+                css_classes=["planning-file-chip"],
+            )
+            
+            chip_icon = _icon("emblem-default-symbolic", 12)
+            chip.append(chip_icon)
+            
+            chip_label = Gtk.Label(label=fname, css_classes=["caption"])
+            chip.append(chip_label)
+            
+            files_box.append(chip)
+            self._file_chips[fname] = (chip, chip_icon)
+        
+        self._plan_box.append(files_box)
+        
+        self.content_box.append(self._plan_box)
     
     def _on_realize(self, widget):
-        """Start polling when widget becomes visible"""
+        """Start watching when widget becomes visible"""
+        self._start_watching()
         self._start_polling()
-        self._update_content()
+        self._dirty = True
+    
+    def _on_map(self, widget):
+        """Catch up on changes skipped while the tab was in the background"""
+        if self._dirty:
+            self._dirty = False
+            self._update_content()
     
     def _on_unrealize(self, widget):
-        """Stop polling when widget is hidden"""
+        """Stop watching when widget is hidden"""
+        self._stop_watching()
         self._stop_polling()
+        if self._pending_refresh_id:
+            GLib.source_remove(self._pending_refresh_id)
+            self._pending_refresh_id = 0
+    
+    def _start_watching(self):
+        """Monitor the planning directory, following it if the setting moved"""
+        # Normalized so it compares equal to the paths the monitor reports;
+        # the default setting leaves a trailing "/."
+        planning_dir = os.path.normpath(self.extension._get_planning_dir())
+        if self._monitor is not None:
+            if planning_dir == self._monitor_dir:
+                return
+            self._stop_watching()
+        try:
+            # The directory need not exist yet; creation is reported too
+            self._monitor = Gio.File.new_for_path(planning_dir).monitor_directory(
+                Gio.FileMonitorFlags.WATCH_MOVES, None
+            )
+        except GLib.Error as e:
+            print(f"Planning monitor error: {e}")
+            return
+        self._monitor_dir = planning_dir
+        self._monitor.connect("changed", self._on_dir_changed)
+    
+    def _stop_watching(self):
+        """Cancel the directory monitor"""
+        if self._monitor is not None:
+            self._monitor.cancel()
+            self._monitor = None
+            self._monitor_dir = None
+    
+    def _on_dir_changed(self, monitor, file, other_file, event_type):
+        """Refresh when a planning file or the directory itself changed"""
+        if event_type not in self._MONITOR_EVENTS:
+            return
+        if (file.get_basename() in PLANNING_FILES
+                or (other_file is not None and other_file.get_basename() in PLANNING_FILES)
+                or file.get_path() == self._monitor_dir):
+            self._schedule_refresh()
     
     def _start_polling(self):
-        """Start polling for planning updates"""
+        """Start the slow fallback poll"""
         if self._poll_source_id is None:
-            self._poll_source_id = GLib.timeout_add(2000, self._poll_planning)
+            self._poll_source_id = GLib.timeout_add_seconds(self._FALLBACK_POLL_SECONDS, self._poll_planning)
     
     def _stop_polling(self):
         """Stop polling"""
@@ -950,228 +1676,246 @@ class PlanningMiniApp(Gtk.Box):
             self._poll_source_id = None
     
     def _poll_planning(self):
-        """Poll for planning file changes"""
+        """Re-arm the monitor if needed and check for missed changes"""
+        self._start_watching()
+        self._schedule_refresh()
+        return True  # Continue polling
+    
+    def _schedule_refresh(self):
+        """Refresh shortly, collapsing bursts of changes into one update"""
+        if not self.get_mapped():
+            self._dirty = True
+            return
+        if self._pending_refresh_id:
+            return
+        self._pending_refresh_id = GLib.timeout_add(self._REFRESH_DELAY_MS, self._do_refresh)
+    
+    def _do_refresh(self):
+        self._pending_refresh_id = 0
+        if not self.get_mapped():
+            self._dirty = True
+            return GLib.SOURCE_REMOVE
         try:
             self._update_content()
         except Exception as e:
-            print(f"Planning polling error: {e}")
-        return True  # Continue polling
+            print(f"Planning refresh error: {e}")
+        return GLib.SOURCE_REMOVE
+    
+    def _on_refresh_clicked(self, button):
+        # Forced: reload and reapply even when nothing on disk seems to
+        # have changed, in case a monitor event was missed
+        self._last_stat_key = None
+        self._applied = None
+        self._schedule_refresh()
     
     def _on_open_folder(self, button):
         """Open planning directory"""
         planning_dir = self.extension._get_planning_dir()
         if os.path.exists(planning_dir):
-            GLib.spawn_command_line_async(f"xdg-open '{planning_dir}'")
+            _open_folder(planning_dir)
     
     def _update_content(self):
-        """Update the content display"""
+        """Load planning data off the main thread; apply() runs back on it"""
+        if self._load_thread is not None:
+            self._reload_requested = True
+            return
+        self._load_thread = threading.Thread(
+            target=self._load_data, args=(self._last_stat_key,), name="planning-mini-load", daemon=True
+        )
+        self._load_thread.start()
+    
+    def _load_data(self, last_stat_key):
+        """Worker: stat and parse the planning files; no GTK calls here.
+        last_stat_key is the key of what is shown, passed in by the main
+        thread that owns it."""
+        stat_key = data = None
         try:
-            data = self.extension._get_planning_data()
-            
-            # Create hash to check if data changed
-            data_hash = f"{data['task_name']}_{data['completed']}_{data['total']}_{data['errors']}"
-            if data_hash == self._last_data_hash:
-                return
-            self._last_data_hash = data_hash
-            
-            # Clear existing content
-            child = self.content_box.get_first_child()
-            while child:
-                next_child = child.get_next_sibling()
-                self.content_box.remove(child)
-                child = next_child
-            
-            if not data['exists']:
-                # Show empty state
+            # Nothing on disk changed since the last refresh
+            stat_key = self.extension._planning_stat_key()
+            if stat_key != last_stat_key:
+                data = self.extension._get_planning_data()
+        except Exception as e:
+            print(f"Error loading planning data: {e}")
+        GLib.idle_add(self._apply_loaded, stat_key, data)
+    
+    def _apply_loaded(self, stat_key, data):
+        self._load_thread = None
+        if data is not None:
+            self._last_stat_key = stat_key
+            try:
+                self.apply(data)
+            except Exception as e:
+                print(f"Error updating planning content: {e}")
+        # A change arrived while loading; pick it up as well
+        if self._reload_requested:
+            self._reload_requested = False
+            self._schedule_refresh()
+        return GLib.SOURCE_REMOVE
+    
+    def apply(self, data: dict):
+        """Show data, calling setters only for the fields that changed"""
+        prev = self._applied
+        self._applied = data
+        
+        def changed(*keys):
+            return prev is None or any(prev[key] != data[key] for key in keys)
+        
+        exists = data['exists']
+        if changed('exists'):
+            self._empty_box.set_visible(not exists)
+            self._plan_box.set_visible(exists)
+        
+        if not exists:
+            if changed('exists'):
                 self.subtitle_label.set_label("No active plan")
                 self.status_label.set_label("Idle")
                 self.status_box.remove_css_class("active")
-                
-                empty_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12)
-                empty_box.set_halign(Gtk.Align.CENTER)
-                empty_box.set_valign(Gtk.Align.CENTER)
-                empty_box.set_vexpand(True)
-                empty_box.set_margin_top(48)
-                empty_box.set_margin_bottom(48)
-                
-                empty_icon = Gtk.Image.new_from_icon_name("document-new-symbolic")
-                empty_icon.set_pixel_size(48)
-                empty_icon.add_css_class("dim-label")
-                empty_box.append(empty_icon)
-                
-                empty_label = Gtk.Label(label="No Active Plan")
-                empty_label.add_css_class("title-4")
-                empty_label.add_css_class("dim-label")
-                empty_box.append(empty_label)
-                
-                empty_hint = Gtk.Label(
-                    label="Use create_plan tool to start planning",
-                    wrap=True,
-                    justify=Gtk.Justification.CENTER,
-                )
-                empty_hint.add_css_class("caption")
-                empty_hint.add_css_class("dim-label")
-                empty_box.append(empty_hint)
-                
-                self.content_box.append(empty_box)
+            return
+        
+        # A plan may have been created since prev; compare everything then
+        if prev is not None and not prev['exists']:
+            prev = None
+        
+        # Parses are cached per (mtime_ns, size) of task_plan.md: the same
+        # todos list means the same parse, so no plan field can differ
+        if prev is not None and prev['todos'] is data['todos']:
+            self._apply_file_chips(data, changed)
+            return
+        
+        if changed('task_name'):
+            self.subtitle_label.set_label(data['task_name'])
+        
+        if changed('completed', 'total'):
+            if data['completed'] < data['total']:
+                self.status_label.set_label("In Progress")
+                self.status_box.add_css_class("active")
             else:
-                # Show planning status
-                self.subtitle_label.set_label(data['task_name'])
-                
-                if data['completed'] < data['total']:
-                    self.status_label.set_label("In Progress")
-                    self.status_box.add_css_class("active")
+                self.status_label.set_label("Complete")
+                self.status_box.remove_css_class("active")
+            
+            progress_pct = int(data['completed'] / data['total'] * 100) if data['total'] > 0 else 0
+            self._progress_label.set_label(f"{data['completed']}/{data['total']} ({progress_pct}%)")
+            self._progress_bar.set_fraction(data['completed'] / data['total'] if data['total'] > 0 else 0)
+            if progress_pct >= 100:
+                self._progress_bar.add_css_class("success")
+            else:
+                self._progress_bar.remove_css_class("success")
+        
+        if changed('errors'):
+            self._error_label.set_label(f"⚠ {data['errors']} error(s) logged")
+            self._error_label.set_visible(data['errors'] > 0)
+        
+        if changed('objective'):
+            if data['objective']:
+                label = _ellipsize(data['objective'], 300)
+                # Edits past the cut leave the visible label as it was
+                if label != self._last_obj_label:
+                    self._obj_text.set_label(label)
+                    self._last_obj_label = label
+            self._obj_box.set_visible(bool(data['objective']))
+        
+        if changed('todos'):
+            self._fill_todo_rows(data['stats'].by_phase)
+            self._todos_box.set_visible(bool(data['todos']))
+        
+        self._apply_file_chips(data, changed)
+    
+    def _apply_file_chips(self, data: dict, changed):
+        if changed('has_findings', 'has_progress'):
+            for fname, exists in (("findings.md", data['has_findings']),
+                                  ("progress.md", data['has_progress'])):
+                chip, chip_icon = self._file_chips[fname]
+                chip_icon.set_from_icon_name("emblem-default-symbolic" if exists else "list-remove-symbolic")
+                if exists:
+                    chip.remove_css_class("missing")
                 else:
-                    self.status_label.set_label("Complete")
-                    self.status_box.remove_css_class("active")
-                
-                # Progress section
-                progress_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=8)
-                progress_box.set_margin_start(16)
-                progress_box.set_margin_end(16)
-                progress_box.set_margin_top(16)
-                
-                progress_pct = int(data['completed'] / data['total'] * 100) if data['total'] > 0 else 0
-                
-                progress_header = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
-                progress_title = Gtk.Label(label="Progress", xalign=0, hexpand=True)
-                progress_title.add_css_class("heading")
-                progress_header.append(progress_title)
-                
-                progress_label = Gtk.Label(label=f"{data['completed']}/{data['total']} ({progress_pct}%)")
-                progress_label.add_css_class("caption")
-                progress_header.append(progress_label)
-                
-                progress_box.append(progress_header)
-                
-                progress_bar = Gtk.ProgressBar()
-                progress_bar.set_fraction(data['completed'] / data['total'] if data['total'] > 0 else 0)
-                if progress_pct >= 100:
-                    progress_bar.add_css_class("success")
-                progress_box.append(progress_bar)
-                
-                if data['errors'] > 0:
-                    error_label = Gtk.Label(label=f"⚠ {data['errors']} error(s) logged", xalign=0)
-                    error_label.add_css_class("error")
-                    error_label.add_css_class("caption")
-                    progress_box.append(error_label)
-                
-                self.content_box.append(progress_box)
-                
-                # Objective section
-                if data['objective']:
-                    obj_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
-                    obj_box.add_css_class("file-content-box")
-                    
-                    obj_title = Gtk.Label(label="Objective", xalign=0)
-                    obj_title.add_css_class("heading")
-                    obj_box.append(obj_title)
-                    
-                    obj_text = Gtk.Label(
-                        label=data['objective'][:300] + ("..." if len(data['objective']) > 300 else ""),
-                        xalign=0,
-                        wrap=True,
-                        wrap_mode=Pango.WrapMode.WORD_CHAR,
-                    )
-                    obj_text.add_css_class("dim-label")
-                    obj_box.append(obj_text)
-                    
-                    self.content_box.append(obj_box)
-                
-                # Todos section
-                if data['todos']:
-                    todos_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
-                    todos_box.add_css_class("file-content-box")
-                    
-                    todos_title = Gtk.Label(label="Tasks", xalign=0)
-                    todos_title.add_css_class("heading")
-                    todos_box.append(todos_title)
-                    
-                    # Group by phase
-                    phases = {}
-                    for todo in data['todos']:
-                        phase = todo.get('phase', 'Other')
-                        if phase not in phases:
-                            phases[phase] = []
-                        phases[phase].append(todo)
-                    
-                    for phase, phase_todos in phases.items():
-                        if len(phases) > 1 and phase:
-                            phase_label = Gtk.Label(label=phase, xalign=0)
-                            phase_label.add_css_class("caption")
-                            phase_label.add_css_class("accent")
-                            phase_label.set_margin_top(8)
-                            todos_box.append(phase_label)
-                        
-                        for todo in phase_todos:
-                            todo_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
-                            todo_row.set_margin_top(4)
-                            
-                            check_icon = Gtk.Image.new_from_icon_name(
-                                "emblem-default-symbolic" if todo['completed'] else "radio-symbolic"
-                            )
-                            check_icon.set_pixel_size(16)
-                            if todo['completed']:
-                                check_icon.add_css_class("success")
-                            else:
-                                check_icon.add_css_class("dim-label")
-                            todo_row.append(check_icon)
-                            
-                            todo_text = Gtk.Label(
-                                label=todo['text'],
-                                xalign=0,
-                                hexpand=True,
-                                wrap=True,
-                                wrap_mode=Pango.WrapMode.WORD_CHAR,
-                            )
-                            if todo['completed']:
-                                todo_text.add_css_class("dim-label")
-                            todo_row.append(todo_text)
-                            
-                            todos_box.append(todo_row)
-                    
-                    self.content_box.append(todos_box)
-                
-                # Files status
-                files_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
-                files_box.set_margin_start(16)
-                files_box.set_margin_end(16)
-                files_box.set_margin_top(8)
-                files_box.set_margin_bottom(16)
-                
-                files_label = Gtk.Label(label="Files:", xalign=0)
-                files_label.add_css_class("caption")
-                files_label.add_css_class("dim-label")
-                files_box.append(files_label)
-                
-                for fname, exists in [("task_plan.md", True), 
-                                       ("findings.md", data['has_findings']),
-                                       ("progress.md", data['has_progress'])]:
-                    chip = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=4)
-                    chip.add_css_class("planning-file-chip")
-                    if not exists:
-                        chip.add_css_class("missing")
-                    
-                    chip_icon = Gtk.Image.new_from_icon_name(
-                        "emblem-default-symbolic" if exists else "list-remove-symbolic"
-                    )
-                    chip_icon.set_pixel_size(12)
-                    chip.append(chip_icon)
-                    
-                    chip_label = Gtk.Label(label=fname)
-                    chip_label.add_css_class("caption")
-                    chip.append(chip_label)
-                    
-                    files_box.append(chip)
-                
-                self.content_box.append(files_box)
-                
-        except Exception as e:
-            print(f"Error updating planning content: {e}")
+                    chip.add_css_class("missing")
+    
+    def _fill_todo_rows(self, phases: dict):
+        """Bring the todo store in line with the given phase groups.
+
+        Items are keyed by (phase, text, occurrence), phase headers by
+        (phase,). Kept items only have their completed flag updated and
+        their row rebound; the store is spliced as a whole only when items
+        were added, removed or moved.
+        """
+        show_phases = len(phases) > 1
+        items = []
+        kept = {}
+        toggled = []
+        for phase, phase_todos in phases.items():
+            if show_phases and phase:
+                header = self._todo_items.pop((phase,), None)
+                if header is None:
+                    header = TodoItem(text=phase, is_header=True)
+                kept[(phase,)] = header
+                items.append(header)
+            
+            seen = {}
+            for todo in phase_todos:
+                occurrence = seen[todo.text] = seen.get(todo.text, -1) + 1
+                key = (phase, todo.text, occurrence)
+                item = self._todo_items.pop(key, None)
+                if item is None:
+                    item = TodoItem(text=todo.text, completed=todo.completed, phase=phase or "")
+                elif item.completed != todo.completed:
+                    item.completed = todo.completed
+                    toggled.append(len(items))
+                kept[key] = item
+                items.append(item)
+        self._todo_items = kept
+        
+        store = self._todo_store
+        n_items = store.get_n_items()
+        if n_items == len(items) and all(store.get_item(i) is item for i, item in enumerate(items)):
+            for position in toggled:
+                store.splice(position, 1, [items[position]])
+        else:
+            store.splice(0, n_items, items)
+    
+    def _on_setup_todo_row(self, factory, list_item):
+        """Build the reusable row template: check icon | wrapping label"""
+        todo_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
+        todo_row.append(_icon("radio-symbolic", 16))
+        todo_row.append(Gtk.Label(
+            xalign=0,
+            hexpand=True,
+            wrap=True,
+            wrap_mode=Pango.WrapMode.WORD_CHAR,
+        ))
+        list_item.set_child(todo_row)
+    
+    def _on_bind_todo_row(self, factory, list_item):
+        """Fill a recycled row from its item"""
+        item = list_item.get_item()
+        todo_row = list_item.get_child()
+        check_icon = todo_row.get_first_child()
+        todo_text = check_icon.get_next_sibling()
+        
+        todo_text.set_label(item.text)
+        check_icon.set_visible(not item.is_header)
+        if item.is_header:
+            todo_row.set_margin_top(8)
+            todo_text.set_css_classes(["caption", "accent"])
+        elif item.completed:
+            todo_row.set_margin_top(4)
+            check_icon.set_from_icon_name("emblem-default-symbolic")
+            check_icon.set_css_classes(["success"])
+            todo_text.set_css_classes(["dim-label"])
+        else:
+            todo_row.set_margin_top(4)
+            check_icon.set_from_icon_name("radio-symbolic")
+            check_icon.set_css_classes(["dim-label"])
+            todo_text.set_css_classes([])
 
 
 # ===================== EXTENSION CLASS =====================
 
+def _shutdown_pools(*pools: ThreadPoolExecutor):
+    for pool in pools:
+        pool.shutdown(wait=False)
+
+
 class NewellePlanningExtension(NewelleExtension):
     """
     NewellePlanning - Manus-style persistent markdown planning
@@ -1180,6 +1924,48 @@ class NewellePlanningExtension(NewelleExtension):
     name = "Newelle Planning"
     id = "newelle_planning"
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._writer = AsyncArtifactWriter()
+        self._journal = PlanJournal()
+        # Overlaps file reads that one tool call needs together
+        self._io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="planning-io")
+        # Runs the widgetless tools; separate so a tool waiting on _io_pool
+        # can never starve it
+        self._tool_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="planning-tool")
+        # An extension dropped on reload stops its idle workers once
+        # collected. Interpreter exit needs nothing here: concurrent.futures
+        # joins pool threads itself before atexit handlers would run.
+        finalizer = weakref.finalize(self, _shutdown_pools, self._io_pool, self._tool_pool)
+        finalizer.atexit = False
+        # Parsed task_plan.md contents by path, as (st_mtime_ns, st_size,
+        # parsed); right after our own writes parsed is the text written
+        self._plan_cache = {}
+        # (planning_dir, st_mtime_ns, has_findings, has_progress, has_plan);
+        # entries only appear or vanish when the directory mtime moves
+        self._dir_state = None
+        # ((cwd, planning_directory setting), planning directory,
+        # {filename: path}); None until needed
+        self._planning_dir_state = None
+        self._tooltip_dir = None
+        # (epoch minute, formatted date) last returned by _get_date()
+        self._date_cache = (None, "")
+        self._planning_dir_display = ""
+        self._planning_dir_tooltip = ""
+        self._mini_apps = weakref.WeakSet()
+        # tool_uuid -> (state, widget) for restored tool calls, see
+        # _restore_widget()
+        self._widget_cache = OrderedDict()
+        # Built by the first get_tools() call
+        self._tools = None
+        # (line, date) Session Log entries not yet written, see _queue_progress()
+        self._pending_progress = deque()
+        self._progress_lock = threading.Lock()
+        self._progress_flush_queued = False
+        # filename -> lock held by _editing() methods
+        self._file_locks = {}
+        self._sync_theme()
+    
     def get_extra_settings(self) -> list:
         return [
             ExtraSettings.EntrySetting(
@@ -1200,6 +1986,18 @@ class NewellePlanningExtension(NewelleExtension):
                 "Show a tab with real-time planning status",
                 True
             ),
+            ExtraSettings.ToggleSetting(
+                "tool_widgets",
+                "Tool Widgets",
+                "Show a card with the result of planning tools in the chat",
+                True
+            ),
+            ExtraSettings.ToggleSetting(
+                "lightweight_theme",
+                "Lightweight Theme",
+                "Draw planning widgets without gradients or rounded corners (faster with software rendering)",
+                _SOFTWARE_GSK
+            ),
         ]
     
     def add_tab_menu_entries(self) -> list:
@@ -1211,20 +2009,43 @@ class NewellePlanningExtension(NewelleExtension):
     
     def _open_planning_tab(self, button):
         """Open the planning mini app tab"""
+        self._sync_theme()
         widget = PlanningMiniApp(self)
+        self._mini_apps.add(widget)
         widget.set_vexpand(True)
         widget.set_hexpand(True)
         tab = self.ui_controller.add_tab(widget)
         tab.set_title("Planning")
         tab.set_icon(Gio.ThemedIcon(name="view-list-bullet-symbolic"))
     
+    def _planning_state(self) -> tuple:
+        # Relative directories follow the working directory, which can
+        # change under us. The setting is read live too: Newelle's settings
+        # page writes it through another instance of the extension.
+        key = (os.getcwd(), self.get_setting("planning_directory") or ".")
+        state = self._planning_dir_state
+        if state is None or state[0] != key:
+            cwd, base_dir = key
+            planning_dir = base_dir if os.path.isabs(base_dir) else os.path.join(cwd, base_dir)
+            state = self._planning_dir_state = (key, planning_dir, {})
+        return state
+    
+    def _file_lock(self, filename: str) -> threading.Lock:
+        lock = self._file_locks.get(filename)
+        if lock is None:
+            lock = self._file_locks.setdefault(filename, threading.Lock())
+        return lock
+    
     def _get_planning_dir(self) -> str:
-        base_dir = self.get_setting("planning_directory")
-        if not base_dir:
-            base_dir = "."
-        if os.path.isabs(base_dir):
-            return base_dir
-        return os.path.join(os.getcwd(), base_dir)
+        return self._planning_state()[1]
+    
+    def _get_open_tooltip(self, planning_dir: str) -> str:
+        """Tooltip for open-folder buttons, rebuilt only when the directory changes"""
+        if planning_dir != self._tooltip_dir:
+            self._tooltip_dir = planning_dir
+            self._planning_dir_display = GLib.filename_display_name(planning_dir)
+            self._planning_dir_tooltip = sys.intern(f"Open {self._planning_dir_display}")
+        return self._planning_dir_tooltip
     
     def _ensure_planning_dir(self) -> str:
         planning_dir = self._get_planning_dir()
@@ -1238,36 +2059,134 @@ class NewellePlanningExtension(NewelleExtension):
         return text
     
     def _get_date(self) -> str:
-        return datetime.datetime.now().strftime("%Y-%m-%d %H:%M")
+        # The stamp only shows minutes, so it is formatted once per minute;
+        # UTC offsets and DST switches fall on minute boundaries too
+        minute = int(time.time()) // 60
+        if minute != self._date_cache[0]:
+            self._date_cache = (minute, time.strftime("%Y-%m-%d %H:%M", time.localtime(minute * 60)))
+        return self._date_cache[1]
     
     def _file_path(self, filename: str) -> str:
-        return os.path.join(self._get_planning_dir(), filename)
+        _, planning_dir, paths = self._planning_state()
+        path = paths.get(filename)
+        if path is None:
+            path = paths[filename] = os.path.join(planning_dir, filename)
+        return path
     
-    def _parse_todos_from_plan(self, content: str) -> list:
-        """Parse todo items from plan content"""
-        todos = []
-        current_phase = None
-        
-        for line in content.split('\n'):
-            phase_match = re.match(r'^###\s+(.+)$', line)
-            if phase_match:
-                current_phase = phase_match.group(1)
-            
-            todo_match = re.match(r'^-\s+\[([ x])\]\s+(.+)$', line)
-            if todo_match:
-                completed = todo_match.group(1) == 'x'
-                text = todo_match.group(2)
-                todos.append({
-                    'text': text,
-                    'completed': completed,
-                    'phase': current_phase
-                })
-        
-        return todos
+    def _read_artifact(self, path: str, limit: int = -1) -> str | None:
+        """Read a planning file once queued writes landed; None if missing.
+        With a limit, at most that many characters are returned."""
+        self._writer.flush()
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                if limit < 0:
+                    return f.read()
+                content = f.read(limit + 1)
+        except FileNotFoundError:
+            return None
+        if len(content) > limit:
+            print(f"Planning file {path} exceeds {limit} characters; only the start is used")
+            content = content[:limit]
+        return content
+    
+    def _contains(self, path: str, needle: bytes) -> bool | None:
+        """Whether a planning file holds needle; None if missing. The file
+        is memory-mapped, so only the pages before the first hit are read."""
+        self._writer.flush()
+        try:
+            with open(path, 'rb') as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                    return view.find(needle) != -1
+        except FileNotFoundError:
+            return None
+        except ValueError:
+            # Empty files cannot be mapped
+            return False
+    
+    def _read_window(self, path: str, start_char: int) -> str | None:
+        """Read only what _truncate can keep of path from start_char on;
+        None if missing, empty past the end of the file"""
+        maxlength = self.get_setting("max_plan_length") or 4000
+        self._writer.flush()
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                # Skip in bounded chunks; text files cannot seek by character
+                while start_char > 0:
+                    skipped = len(f.read(min(start_char, 65536)))
+                    if not skipped:
+                        break
+                    start_char -= skipped
+                return f.read(maxlength + 1)
+        except FileNotFoundError:
+            return None
+    
+    def _write_plan(self, plan_path: str, content: str, previous: str = None):
+        """Write task_plan.md and drop its parsed cache entry. When content
+        only extends previous, the file that holds it, just the tail is
+        appended."""
+        if previous is not None and len(content) > len(previous) and content.startswith(previous):
+            with open(plan_path, 'a', encoding='utf-8') as f:
+                f.write(content[len(previous):])
+        else:
+            _atomic_write(plan_path, content.encode('utf-8'))
+        self._journal.remember(plan_path, content)
+        self._seed_plan(plan_path, content)
+    
+    def _seed_plan(self, plan_path: str, content: str):
+        """Hand the text just written to the next _get_planning_data(), which
+        then parses it instead of reading the file back. This also replaces
+        the old entry, which a same-size edit within one timestamp tick
+        would keep matching."""
+        try:
+            st = os.stat(plan_path)
+        except FileNotFoundError:
+            self._plan_cache.pop(plan_path, None)
+            return
+        self._plan_cache[plan_path] = (st.st_mtime_ns, st.st_size, content[:_PLAN_PARSE_LIMIT])
+    
+    def _patch_plan(self, plan_path: str, offset: int, expected: bytes, replacement: bytes) -> bool:
+        """Overwrite a same-length line of task_plan.md in place; False if
+        the file does not hold exactly expected at offset"""
+        try:
+            with open(plan_path, 'r+b') as f:
+                f.seek(offset)
+                if f.read(len(expected)) != expected:
+                    return False
+                f.seek(offset)
+                f.write(replacement)
+        except FileNotFoundError:
+            return False
+        self._plan_cache.pop(plan_path, None)
+        return True
+    
+    def _write_artifact(self, path: str, content: str, critical: bool = False) -> Future:
+        # The file may be new within the directory's current mtime tick
+        self._dir_state = None
+        return self._writer.enqueue(path, content.encode('utf-8'), critical, self._on_artifact_written)
+    
+    def _journal_append(self, path: str, heading: str, text: str) -> bool:
+        """Append text to the trailing section of path without rewriting it"""
+        self._writer.flush()
+        if not self._journal.append(path, heading, text.encode('utf-8')):
+            return False
+        GLib.idle_add(self._on_artifact_written, path)
+        return True
+    
+    def _rewrite_journaled(self, path: str, content: str):
+        """Rewrite a journaled file and let the next entry append again"""
+        # A failed write raises here, before the journal records it
+        self._write_artifact(path, content).result()
+        self._journal.remember(path, content)
+    
+    def _on_artifact_written(self, path: str):
+        for app in list(self._mini_apps):
+            app._schedule_refresh()
+        return False
     
     def _get_planning_data(self) -> dict:
         """Get all planning data"""
         planning_dir = self._get_planning_dir()
+        self._writer.flush()
         data = {
             'task_name': 'No Plan',
             'objective': '',
@@ -1275,444 +2194,531 @@ class NewellePlanningExtension(NewelleExtension):
             'completed': 0,
             'total': 0,
             'errors': 0,
+            'stats': EMPTY_STATS,
             'exists': False,
             'planning_dir': planning_dir,
-            'has_findings': os.path.exists(self._file_path("findings.md")),
-            'has_progress': os.path.exists(self._file_path("progress.md")),
+            'open_tooltip': self._get_open_tooltip(planning_dir),
+            'has_findings': False,
+            'has_progress': False,
         }
         
+        try:
+            dir_mtime = os.stat(planning_dir).st_mtime_ns
+        except FileNotFoundError:
+            return data
+        if self._dir_state is None or self._dir_state[:2] != (planning_dir, dir_mtime):
+            # One directory listing answers every presence question
+            with os.scandir(planning_dir) as entries:
+                names = {entry.name for entry in entries}
+            self._dir_state = (
+                planning_dir,
+                dir_mtime,
+                "findings.md" in names,
+                "progress.md" in names,
+                "task_plan.md" in names,
+            )
+        data['has_findings'], data['has_progress'], has_plan = self._dir_state[2:]
+        if not has_plan:
+            return data
+        
         plan_path = self._file_path("task_plan.md")
-        if os.path.exists(plan_path):
-            with open(plan_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            data['exists'] = True
-            
-            if "# Task Plan:" in content:
-                task_line = content.split('\n')[0]
-                data['task_name'] = task_line.replace("# Task Plan:", "").strip()
-            
-            obj_match = re.search(r'## Objective\n(.+?)(?=\n##|\Z)', content, re.DOTALL)
-            if obj_match:
-                data['objective'] = obj_match.group(1).strip()
-            
-            data['todos'] = self._parse_todos_from_plan(content)
-            data['completed'] = sum(1 for t in data['todos'] if t['completed'])
-            data['total'] = len(data['todos'])
-            data['errors'] = content.count('### Error at')
+        try:
+            st = os.stat(plan_path)
+        except FileNotFoundError:
+            return data
+        
+        key = (st.st_mtime_ns, st.st_size)
+        cached = self._plan_cache.get(plan_path)
+        if cached and cached[:2] == key:
+            parsed = cached[2]
+            if isinstance(parsed, str):
+                parsed = self._parse_plan(parsed)
+                self._plan_cache[plan_path] = (*key, parsed)
+        else:
+            content = self._read_artifact(plan_path, _PLAN_PARSE_LIMIT)
+            if content is None:
+                return data
+            parsed = self._parse_plan(content)
+            self._plan_cache[plan_path] = (*key, parsed)
         
+        data.update(parsed)
         return data
     
+    def _parse_plan(self, content: str) -> dict:
+        """Extract the task name, objective, todos and error count from a plan
+        in a single walk over its lines"""
+        parsed = {'exists': True}
+        lines = content.splitlines()
+        
+        if lines and "# Task Plan:" in lines[0]:
+            parsed['task_name'] = lines[0].replace("# Task Plan:", "").strip()
+        
+        todos = []
+        errors = 0
+        current_phase = None
+        objective = None
+        in_objective = False
+        
+        for line in lines:
+            # Only headings and list items can match; skip the rest cheaply
+            first = line[:1]
+            if in_objective:
+                if line.startswith('##'):
+                    in_objective = False
+                else:
+                    objective.append(line)
+            if first == '#':
+                if line == '## Objective' and objective is None:
+                    objective = []
+                    in_objective = True
+                elif line.startswith('### Error at'):
+                    errors += 1
+                # Canonical "### Name" headings are sliced; the regex only
+                # sees unusual spacing
+                # Interned so every todo of a phase, across parses, shares
+                # one string and dict lookups compare by identity first
+                if line.startswith('### ') and line[4:5].strip():
+                    current_phase = sys.intern(line[4:])
+                elif line.startswith('###'):
+                    phase_match = _RE_PHASE.match(line)
+                    if phase_match:
+                        current_phase = sys.intern(phase_match.group(1))
+                continue
+            if first != '-':
+                continue
+            
+            if (line.startswith('- [ ] ') or line.startswith('- [x] ')) and line[6:7].strip():
+                completed = line[3] == 'x'
+                text = line[6:]
+            else:
+                todo_match = _RE_TODO.match(line)
+                if not todo_match:
+                    continue
+                completed = todo_match.group(1) == 'x'
+                text = todo_match.group(2)
+            todos.append(Todo(text, completed, current_phase))
+        
+        if objective:
+            objective = "\n".join(objective).strip()
+            if objective:
+                parsed['objective'] = objective
+        
+        stats = _todo_stats(todos, errors)
+        parsed['todos'] = todos
+        parsed['stats'] = stats
+        parsed['completed'] = stats.completed
+        parsed['total'] = stats.total
+        parsed['errors'] = stats.errors
+        return parsed
+    
+    def _planning_stat_key(self) -> tuple:
+        """(mtime_ns, size) of each planning file, None for missing ones"""
+        key = [self._get_planning_dir()]
+        for filename in PLANNING_FILES:
+            try:
+                st = os.stat(self._file_path(filename))
+                key.append((st.st_mtime_ns, st.st_size))
+            except FileNotFoundError:
+                key.append(None)
+        return tuple(key)
+    
     # === Core Operations ===
     
+    @_tool_error("creating plan")
+    @_editing("task_plan.md")
     def create_plan(self, task_name: str, objective: str, phases: list[str] = None) -> str:
-        try:
-            planning_dir = self._ensure_planning_dir()
-            date = self._get_date()
-            
-            if not phases:
-                phases_content = """### Phase 1: Planning
-- [ ] Define requirements
-- [ ] Identify dependencies
-- [ ] Create initial plan
-"""
-            else:
-                phases_content = ""
-                for i, phase in enumerate(phases, 1):
-                    phases_content += f"### Phase {i}: {phase}\n- [ ] \n\n"
-                phases_content = phases_content.strip()
-            
-            task_plan_content = TASK_PLAN_TEMPLATE.format(
-                task_name=task_name, date=date, objective=objective, phases=phases_content
-            )
-            with open(self._file_path("task_plan.md"), 'w', encoding='utf-8') as f:
-                f.write(task_plan_content)
-            
-            findings_content = FINDINGS_TEMPLATE.format(task_name=task_name, date=date)
-            with open(self._file_path("findings.md"), 'w', encoding='utf-8') as f:
-                f.write(findings_content)
-            
-            progress_content = PROGRESS_TEMPLATE.format(task_name=task_name, date=date)
-            with open(self._file_path("progress.md"), 'w', encoding='utf-8') as f:
-                f.write(progress_content)
-            
-            return f"✅ Created planning files in {planning_dir}\n\nTask: {task_name}\nObjective: {objective}"
-            
-        except Exception as e:
-            return f"❌ Error creating plan: {str(e)}"
+        self._settle_progress()
+        planning_dir = self._ensure_planning_dir()
+        bundle = render_plan_bundle(task_name, self._get_date(), objective, phases)
+        self._plan_cache.pop(self._file_path("task_plan.md"), None)
+        self._dir_state = None
+        # Only report the plan once it is on disk; a failed write raises here
+        self._writer.enqueue_bundle(planning_dir, bundle, callback=self._on_artifact_written).result()
+        
+        return f"✅ Created planning files in {planning_dir}\n\nTask: {task_name}\nObjective: {objective}"
     
+    @_tool_error("reading plan")
     def read_plan(self, start_char: int = 0) -> str:
-        try:
-            plan_path = self._file_path("task_plan.md")
-            if not os.path.exists(plan_path):
-                return "⚠️ No task_plan.md found. Use create_plan to start."
-            
-            with open(plan_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+        content = self._read_window(self._file_path("task_plan.md"), start_char)
+        if content is None:
+            return "⚠️ No task_plan.md found. Use create_plan to start."
+        
+        if start_char > 0 and not content:
+            return "⚠️ End of file reached."
             
-            if start_char > 0:
-                if start_char >= len(content):
-                    return "⚠️ End of file reached."
-                content = content[start_char:]
-                
-            return self._truncate(content)
-        except Exception as e:
-            return f"❌ Error reading plan: {str(e)}"
+        return self._truncate(content)
     
+    @_tool_error("updating plan")
+    @_editing("task_plan.md")
     def update_plan(self, section: str, content: str) -> str:
-        try:
-            plan_path = self._file_path("task_plan.md")
-            if not os.path.exists(plan_path):
-                return "⚠️ No task_plan.md found."
-            
-            with open(plan_path, 'r', encoding='utf-8') as f:
-                plan_content = f.read()
+        plan_path = self._file_path("task_plan.md")
+        plan_content = self._read_artifact(plan_path)
+        if plan_content is None:
+            return "⚠️ No task_plan.md found."
+        
+        section_marker = f"## {section}"
+        if section_marker in plan_content:
+            section_start = plan_content.index(section_marker) + len(section_marker)
+            next_section = plan_content.find("\n## ", section_start)
             
-            section_marker = f"## {section}"
-            if section_marker in plan_content:
-                section_start = plan_content.index(section_marker) + len(section_marker)
-                next_section = plan_content.find("\n## ", section_start)
-                
-                if next_section == -1:
-                    new_content = plan_content[:section_start] + f"\n{content}\n"
-                else:
-                    new_content = (
-                        plan_content[:section_start] + 
-                        f"\n{content}\n" + 
-                        plan_content[next_section:]
-                    )
-                
-                with open(plan_path, 'w', encoding='utf-8') as f:
-                    f.write(new_content)
-                return f"✅ Updated section '{section}'"
+            if next_section == -1:
+                new_content = plan_content[:section_start] + f"\n{content}\n"
             else:
-                new_content = plan_content.rstrip() + f"\n\n## {section}\n{content}\n"
-                with open(plan_path, 'w', encoding='utf-8') as f:
-                    f.write(new_content)
-                return f"✅ Added new section '{section}'"
-                
-        except Exception as e:
-            return f"❌ Error updating plan: {str(e)}"
+                new_content = (
+                    plan_content[:section_start] + 
+                    f"\n{content}\n" + 
+                    plan_content[next_section:]
+                )
+            
+            self._write_plan(plan_path, new_content, plan_content)
+            return f"✅ Updated section '{section}'"
+        else:
+            new_content = plan_content.rstrip() + f"\n\n## {section}\n{content}\n"
+            self._write_plan(plan_path, new_content, plan_content)
+            return f"✅ Added new section '{section}'"
     
+    @_tool_error()
+    @_editing("task_plan.md")
     def mark_complete(self, phase_or_item: str) -> str:
-        try:
-            plan_path = self._file_path("task_plan.md")
-            if not os.path.exists(plan_path):
-                return "⚠️ No task_plan.md found."
-            
-            with open(plan_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            
-            target = phase_or_item.strip().lower()
-            best_match_idx = -1
-            
-            # Helper to check if line is an incomplete task
-            def is_incomplete_task(line):
-                return re.match(r'^\s*[-*]\s*\[ \]', line) is not None
-
-            # 1. Exact match search
-            for i, line in enumerate(lines):
-                if not is_incomplete_task(line):
-                    continue
-                
-                task_text = re.sub(r'^\s*[-*]\s*\[ \]\s*', '', line).strip()
-                if task_text == phase_or_item.strip():
-                    best_match_idx = i
-                    break
-            
-            # 2. Substring/Fuzzy match if no exact match
-            if best_match_idx == -1:
-                candidates = []
-                for i, line in enumerate(lines):
-                    if not is_incomplete_task(line):
-                        continue
-                        
-                    task_text = re.sub(r'^\s*[-*]\s*\[ \]\s*', '', line).strip()
-                    task_lower = task_text.lower()
-                    
-                    # Substring match (high priority)
-                    if target in task_lower:
-                        candidates.append((i, 0.9, task_text))
-                        continue
-                        
-                    # Fuzzy match
-                    ratio = difflib.SequenceMatcher(None, target, task_lower).ratio()
-                    if ratio > 0.8: # Threshold
-                        candidates.append((i, ratio, task_text))
+        plan_path = self._file_path("task_plan.md")
+        content = self._read_artifact(plan_path)
+        if content is None:
+            return "⚠️ No task_plan.md found."
+        lines = content.splitlines(keepends=True)
+        
+        # One match per line gives both the checkbox position and the text
+        open_todos = []
+        for i, line in enumerate(lines):
+            todo_match = _RE_OPEN_TODO.match(line)
+            if todo_match:
+                open_todos.append((i, todo_match.end(1), todo_match.group(2).strip()))
+        
+        target = phase_or_item.strip().lower()
+        best_match = None
+        
+        # 1. Exact match search
+        for todo in open_todos:
+            if todo[2] == phase_or_item.strip():
+                best_match = todo
+                break
+        
+        # 2. Substring/Fuzzy match if no exact match
+        if best_match is None:
+            candidates = []
+            # Once a substring hit (0.9) exists, only a better fuzzy
+            # score could change the outcome
+            floor = 0.8
+            for todo in open_todos:
+                task_lower = todo[2].lower()
                 
-                # Sort by score desc
-                if candidates:
-                    candidates.sort(key=lambda x: x[1], reverse=True)
-                    best_match_idx = candidates[0][0]
+                # Substring match (high priority)
+                if target in task_lower:
+                    candidates.append((todo, 0.9))
+                    floor = 0.9
+                    continue
                     
-            if best_match_idx != -1:
-                line = lines[best_match_idx]
-                # Replace [ ] with [x] preserving indentation and bullet style
-                new_line = re.sub(r'(\s*[-*]\s*)\[ \]', r'\1[x]', line, count=1)
-                lines[best_match_idx] = new_line
-                
-                with open(plan_path, 'w', encoding='utf-8') as f:
-                    f.writelines(lines)
+                # Fuzzy match
+                ratio = _fuzzy_ratio(target, task_lower, floor)
+                if ratio > floor:
+                    candidates.append((todo, ratio))
+            
+            # Sort by score desc
+            if candidates:
+                candidates.sort(key=lambda x: x[1], reverse=True)
+                best_match = candidates[0][0]
                 
-                task_text = re.sub(r'^\s*[-*]\s*\[ \]\s*', '', line).strip()
-                return f"✅ Marked as complete: {task_text}"
+        if best_match is not None:
+            best_match_idx, box, task_text = best_match
+            line = lines[best_match_idx]
+            # Replace [ ] with [x] preserving indentation and bullet style
+            lines[best_match_idx] = line[:box] + "[x]" + line[box + 3:]
+            # Tick the box in place: same length, so the file keeps its
+            # layout. Offsets come from the newline-translated text, so the
+            # whole line, newline included, is checked at the raw offset;
+            # CRLF files fail that check and are rewritten instead.
+            offset = len("".join(lines[:best_match_idx]).encode('utf-8'))
+            if self._patch_plan(plan_path, offset, line.encode('utf-8'), lines[best_match_idx].encode('utf-8')):
+                # The sections did not move, only the stat key did
+                self._journal.remember(plan_path, content)
+                self._seed_plan(plan_path, "".join(lines))
+            else:
+                self._write_plan(plan_path, "".join(lines))
             
-            return f"⚠️ Item '{phase_or_item}' not found (or already completed)"
-                
-        except Exception as e:
-            return f"❌ Error: {str(e)}"
+            return f"✅ Marked as complete: {task_text}"
+        
+        return f"⚠️ Item '{phase_or_item}' not found (or already completed)"
     
+    @_tool_error()
+    @_editing("task_plan.md")
     def add_todo(self, item: str, phase: str = None) -> str:
-        try:
-            plan_path = self._file_path("task_plan.md")
-            if not os.path.exists(plan_path):
-                return "⚠️ No task_plan.md found."
-            
-            with open(plan_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            new_item = f"- [ ] {item}"
+        plan_path = self._file_path("task_plan.md")
+        content = original = self._read_artifact(plan_path)
+        if content is None:
+            return "⚠️ No task_plan.md found."
+        
+        new_item = f"- [ ] {item}"
+        
+        if phase:
+            # Try exact match first
+            phase_marker = f"### {phase}"
+            phase_start = -1
             
-            if phase:
-                # Try exact match first
-                phase_marker = f"### {phase}"
-                phase_start = -1
+            if phase_marker in content:
+                phase_start = content.index(phase_marker)
+            else:
+                # Try to find fuzzy match (e.g. "Phase 1: Analysis" matching "Analysis")
+                # We look for a line starting with ### containing the phase name
+                pattern = re.compile(rf"^###\s+.*{re.escape(phase)}", re.MULTILINE | re.IGNORECASE)
+                match = pattern.search(content)
+                if match:
+                    phase_marker = match.group(0)
+                    phase_start = match.start()
+            
+            if phase_start != -1:
+                next_section = content.find("\n###", phase_start + 1)
+                next_h2 = content.find("\n## ", phase_start + 1)
                 
-                if phase_marker in content:
-                    phase_start = content.index(phase_marker)
-                else:
-                    # Try to find fuzzy match (e.g. "Phase 1: Analysis" matching "Analysis")
-                    # We look for a line starting with ### containing the phase name
-                    pattern = re.compile(rf"^###\s+.*{re.escape(phase)}", re.MULTILINE | re.IGNORECASE)
-                    match = pattern.search(content)
-                    if match:
-                        phase_marker = match.group(0)
-                        phase_start = match.start()
+                # Find the earliest next section (subsection or main section)
+                possible_ends = [p for p in [next_section, next_h2] if p != -1]
+                insert_pos = min(possible_ends) if possible_ends else len(content)
                 
-                if phase_start != -1:
-                    next_section = content.find("\n###", phase_start + 1)
-                    next_h2 = content.find("\n## ", phase_start + 1)
-                    
-                    # Find the earliest next section (subsection or main section)
-                    possible_ends = [p for p in [next_section, next_h2] if p != -1]
-                    insert_pos = min(possible_ends) if possible_ends else len(content)
-                    
-                    content = content[:insert_pos].rstrip() + f"\n{new_item}\n" + content[insert_pos:]
-                else:
-                    content = content.rstrip() + f"\n\n### {phase}\n{new_item}\n"
+                content = content[:insert_pos].rstrip() + f"\n{new_item}\n" + content[insert_pos:]
             else:
-                if "## Phases" in content:
-                    notes_pos = content.find("## Notes")
-                    error_pos = content.find("## Error Log")
-                    insert_pos = min(p for p in [notes_pos, error_pos, len(content)] if p > 0)
-                    content = content[:insert_pos].rstrip() + f"\n{new_item}\n\n" + content[insert_pos:]
-                else:
-                    content = content.rstrip() + f"\n\n## Tasks\n{new_item}\n"
-            
-            with open(plan_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-            
-            return f"✅ Added todo: {item}" + (f" (Phase: {phase})" if phase else "")
-            
-        except Exception as e:
-            return f"❌ Error: {str(e)}"
+                content = content.rstrip() + f"\n\n### {phase}\n{new_item}\n"
+        else:
+            if "## Phases" in content:
+                notes_pos = content.find("## Notes")
+                error_pos = content.find("## Error Log")
+                insert_pos = min(p for p in [notes_pos, error_pos, len(content)] if p > 0)
+                content = content[:insert_pos].rstrip() + f"\n{new_item}\n\n" + content[insert_pos:]
+            else:
+                content = content.rstrip() + f"\n\n## Tasks\n{new_item}\n"
+        
+        self._write_plan(plan_path, content, original)
+        
+        return f"✅ Added todo: {item}" + (f" (Phase: {phase})" if phase else "")
     
+    @_tool_error()
+    @_editing("findings.md")
     def save_finding(self, title: str, content: str, category: str = "Key Discoveries") -> str:
-        try:
-            findings_path = self._file_path("findings.md")
-            if not os.path.exists(findings_path):
-                self._ensure_planning_dir()
-                with open(findings_path, 'w', encoding='utf-8') as f:
-                    f.write(FINDINGS_TEMPLATE.format(task_name="Task", date=self._get_date()))
-            
-            with open(findings_path, 'r', encoding='utf-8') as f:
-                findings_content = f.read()
-            
-            timestamp = self._get_date()
-            new_finding = f"\n### {title}\n*{timestamp}*\n\n{content}\n"
-            
-            category_marker = f"## {category}"
-            if category_marker in findings_content:
-                category_pos = findings_content.index(category_marker) + len(category_marker)
-                next_h2 = findings_content.find("\n## ", category_pos)
-                
-                if next_h2 == -1:
-                    findings_content = findings_content.rstrip() + new_finding
-                else:
-                    findings_content = (
-                        findings_content[:next_h2].rstrip() + 
-                        new_finding + "\n" + 
-                        findings_content[next_h2:]
-                    )
-            else:
-                findings_content = findings_content.rstrip() + f"\n\n## {category}{new_finding}"
-            
-            with open(findings_path, 'w', encoding='utf-8') as f:
-                f.write(findings_content)
-            
+        findings_path = self._file_path("findings.md")
+        timestamp = self._get_date()
+        new_finding = f"\n### {title}\n*{timestamp}*\n\n{content}\n"
+        category_marker = f"## {category}"
+        if self._journal_append(findings_path, category_marker, new_finding):
             return f"✅ Saved finding: '{title}'"
+        
+        findings_content = self._read_artifact(findings_path)
+        if findings_content is None:
+            self._ensure_planning_dir()
+            findings_content = FINDINGS_TEMPLATE.format_map({'task_name': "Task", 'date': timestamp})
+        
+        if _last_heading(findings_content) == category_marker:
+            findings_content = findings_content.rstrip() + new_finding
+        elif category_marker in findings_content:
+            category_pos = findings_content.index(category_marker) + len(category_marker)
+            next_h2 = findings_content.find("\n## ", category_pos)
             
-        except Exception as e:
-            return f"❌ Error: {str(e)}"
+            if next_h2 == -1:
+                findings_content = findings_content.rstrip() + new_finding
+            else:
+                findings_content = (
+                    findings_content[:next_h2].rstrip() + 
+                    new_finding + "\n" + 
+                    findings_content[next_h2:]
+                )
+        else:
+            findings_content = findings_content.rstrip() + f"\n\n## {category}{new_finding}"
+        
+        self._rewrite_journaled(findings_path, findings_content)
+        
+        return f"✅ Saved finding: '{title}'"
     
+    @_tool_error()
     def read_findings(self, start_char: int = 0) -> str:
-        try:
-            findings_path = self._file_path("findings.md")
-            if not os.path.exists(findings_path):
-                return "⚠️ No findings.md found."
-            
-            with open(findings_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+        content = self._read_window(self._file_path("findings.md"), start_char)
+        if content is None:
+            return "⚠️ No findings.md found."
+        
+        if start_char > 0 and not content:
+            return "⚠️ End of file reached."
             
-            if start_char > 0:
-                if start_char >= len(content):
-                    return "⚠️ End of file reached."
-                content = content[start_char:]
-                
-            return self._truncate(content)
-        except Exception as e:
-            return f"❌ Error: {str(e)}"
+        return self._truncate(content)
     
-    def log_progress(self, entry: str, include_timestamp: bool = True) -> str:
+    def _append_progress(self, new_entry: str, date: str):
+        """Add a line to the Session Log of progress.md"""
+        progress_path = self._file_path("progress.md")
+        if self._journal_append(progress_path, "## Session Log", f"{new_entry}\n"):
+            return
+        
+        content = self._read_artifact(progress_path)
+        if content is None:
+            self._ensure_planning_dir()
+            content = PROGRESS_TEMPLATE.format_map({'task_name': "Task", 'date': date})
+        
+        # Older files have sections after the log; moving it last once
+        # lets every later entry be appended
+        content = _section_last(content, "## Session Log").rstrip() + f"\n{new_entry}\n"
+        
+        self._rewrite_journaled(progress_path, content)
+    
+    def _queue_progress(self, new_entry: str, date: str):
+        """Buffer a Session Log line. Lines logged in a burst are written
+        together once the main loop is idle."""
+        with self._progress_lock:
+            self._pending_progress.append((new_entry, date))
+            if not self._progress_flush_queued:
+                self._progress_flush_queued = True
+                GLib.idle_add(self._dispatch_progress)
+    
+    def _dispatch_progress(self):
+        """Idle handler: hand the buffered lines to a worker, as writing
+        them may mean reading and rewriting progress.md"""
         try:
-            progress_path = self._file_path("progress.md")
-            if not os.path.exists(progress_path):
-                self._ensure_planning_dir()
-                with open(progress_path, 'w', encoding='utf-8') as f:
-                    f.write(PROGRESS_TEMPLATE.format(task_name="Task", date=self._get_date()))
-            
-            with open(progress_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            timestamp = f"[{self._get_date()}] " if include_timestamp else ""
-            new_entry = f"- {timestamp}{entry}"
-            
-            if "## Session Log" in content:
-                session_pos = content.index("## Session Log") + len("## Session Log")
-                content = content[:session_pos] + f"\n{new_entry}" + content[session_pos:]
-            else:
-                content = content.rstrip() + f"\n\n## Session Log\n{new_entry}\n"
-            
-            with open(progress_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-            
-            return f"✅ Logged: {entry}"
-            
-        except Exception as e:
-            return f"❌ Error: {str(e)}"
+            self._io_pool.submit(self._flush_progress)
+        except RuntimeError:
+            # The pool is shut down with the extension; write the last lines here
+            self._flush_progress()
+        return False
+    
+    def _flush_progress(self):
+        """Write buffered Session Log lines with one append. Their tools
+        already reported success, so lines that could not be written stay
+        buffered and go out with the next flush."""
+        with self._progress_lock:
+            self._progress_flush_queued = False
+            if not self._pending_progress:
+                return
+            entries = list(self._pending_progress)
+            self._pending_progress.clear()
+            try:
+                self._append_progress("\n".join(line for line, _ in entries), entries[0][1])
+            except Exception as e:
+                print(f"Could not write progress.md: {e}")
+                self._pending_progress.extendleft(reversed(entries))
+    
+    def _settle_progress(self):
+        """Write buffered lines to the plan they were logged for, before
+        it is replaced or removed; lines that cannot be written are dropped"""
+        self._flush_progress()
+        with self._progress_lock:
+            if self._pending_progress:
+                print(f"Dropped {len(self._pending_progress)} unwritten progress.md lines")
+                self._pending_progress.clear()
+    
+    @_tool_error()
+    def log_progress(self, entry: str, include_timestamp: bool = True) -> str:
+        date = self._get_date()
+        timestamp = f"[{date}] " if include_timestamp else ""
+        # Written once the main loop is idle, together with the rest of the burst
+        self._queue_progress(f"- {timestamp}{entry}", date)
+        
+        return f"✅ Logged: {entry}"
     
+    @_tool_error()
+    @_editing("task_plan.md")
     def log_error(self, error: str, context: str = "") -> str:
-        try:
-            plan_path = self._file_path("task_plan.md")
-            if not os.path.exists(plan_path):
+        plan_path = self._file_path("task_plan.md")
+        timestamp = self._get_date()
+        error_entry = f"\n### Error at {timestamp}\n**Error:** {error}\n"
+        if context:
+            error_entry += f"**Context:** {context}\n"
+        
+        if self._journal_append(plan_path, "## Error Log", error_entry):
+            self._plan_cache.pop(plan_path, None)
+        else:
+            content = self._read_artifact(plan_path)
+            if content is None:
                 return "⚠️ No task_plan.md found."
-            
-            with open(plan_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            timestamp = self._get_date()
-            error_entry = f"\n### Error at {timestamp}\n**Error:** {error}\n"
-            if context:
-                error_entry += f"**Context:** {context}\n"
-            
-            if "## Error Log" in content:
-                error_pos = content.index("## Error Log") + len("## Error Log")
-                next_h2 = content.find("\n## ", error_pos)
-                
-                if next_h2 == -1:
-                    content = content.rstrip() + error_entry
-                else:
-                    content = content[:next_h2].rstrip() + error_entry + "\n" + content[next_h2:]
-            else:
-                content = content.rstrip() + f"\n\n## Error Log{error_entry}"
-            
-            with open(plan_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-            
-            self.log_progress(f"ERROR: {error}")
-            
-            return f"⚠️ Logged error: {error}"
-            
-        except Exception as e:
-            return f"❌ Error: {str(e)}"
+            # Plans from before the Error Log came last get it moved
+            # there on their first error
+            content = _section_last(content, "## Error Log").rstrip() + error_entry
+            self._write_plan(plan_path, content)
+        
+        # Same timestamp as the plan entry, queued behind earlier lines
+        self._queue_progress(f"- [{timestamp}] ERROR: {error}", timestamp)
+        
+        return f"⚠️ Logged error: {error}"
     
+    @_tool_error()
     def get_status(self) -> str:
-        try:
-            data = self._get_planning_data()
-            
-            if not data['exists']:
-                return "📋 No active planning session. Use create_plan to start."
-            
-            progress_pct = int(data['completed'] / data['total'] * 100) if data['total'] > 0 else 0
-            
-            return f"""📋 **{data['task_name']}**
+        # A first entry may be what creates progress.md
+        self._flush_progress()
+        data = self._get_planning_data()
+        
+        if not data['exists']:
+            return "📋 No active planning session. Use create_plan to start."
+        
+        progress_pct = int(data['completed'] / data['total'] * 100) if data['total'] > 0 else 0
+        
+        return f"""📋 **{data['task_name']}**
 
 Progress: {data['completed']}/{data['total']} ({progress_pct}%)
 Errors: {data['errors']}
 Directory: {data['planning_dir']}
 
 Files: task_plan.md ✅ | findings.md {'✅' if data['has_findings'] else '❌'} | progress.md {'✅' if data['has_progress'] else '❌'}"""
-            
-        except Exception as e:
-            return f"❌ Error: {str(e)}"
     
+    @_tool_error()
+    @_editing("task_plan.md")
     def cleanup_plan(self) -> str:
-        try:
-            planning_dir = self._get_planning_dir()
-            
-            if not os.path.exists(planning_dir):
-                return "⚠️ No planning directory."
-            
-            files_removed = []
-            for filename in ["task_plan.md", "findings.md", "progress.md"]:
-                filepath = self._file_path(filename)
-                if os.path.exists(filepath):
-                    os.remove(filepath)
-                    files_removed.append(filename)
-            
+        self._settle_progress()
+        planning_dir = self._get_planning_dir()
+        self._writer.flush()
+        self._journal.close()
+        
+        # Removing is the existence check; a missing directory shows up
+        # as every removal and the final rmdir failing
+        files_removed = []
+        for filename in PLANNING_FILES:
             try:
-                os.rmdir(planning_dir)
-                return f"✅ Cleaned up: {', '.join(files_removed)}"
-            except OSError:
-                return f"✅ Cleaned up: {', '.join(files_removed)} (directory kept)"
-                
-        except Exception as e:
-            return f"❌ Error: {str(e)}"
+                os.remove(os.path.join(planning_dir, filename))
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            files_removed.append(filename)
+        # A plan recreated within the same timestamp tick and with the
+        # same size would otherwise match the stale stat key
+        self._plan_cache.pop(os.path.join(planning_dir, "task_plan.md"), None)
+        self._dir_state = None
+        
+        try:
+            os.rmdir(planning_dir)
+            return f"✅ Cleaned up: {', '.join(files_removed)}"
+        except FileNotFoundError:
+            return "⚠️ No planning directory."
+        except OSError:
+            return f"✅ Cleaned up: {', '.join(files_removed)} (directory kept)"
 
+    @_tool_error("checking integrity")
     def check_plan_integrity(self) -> str:
-        try:
-            data = self._get_planning_data()
-            if not data['exists']:
-                return "⚠️ No plan found."
-            
-            issues = []
-            
-            # Check files
-            if not data['has_findings']:
-                issues.append("- Missing findings.md")
-            if not data['has_progress']:
-                issues.append("- Missing progress.md")
-                
-            # Check tasks
-            pending = data['total'] - data['completed']
-            if pending > 0:
-                issues.append(f"- {pending} tasks pending in task_plan.md")
-            
-            # Check progress log
-            progress_path = self._file_path("progress.md")
-            if os.path.exists(progress_path):
-                with open(progress_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    if "- " not in content:
-                        issues.append("- progress.md seems empty (no bullet points)")
-            
-            if not issues:
-                return f"✅ Plan Integrity Check Passed!\n- All files present\n- All {data['total']} tasks completed\n- Progress logged"
-            
-            return "⚠️ Plan Incomplete / Issues Found:\n" + "\n".join(issues)
+        self._flush_progress()
+        # Scan progress.md while task_plan.md is stat'ed and parsed
+        has_bullets = self._io_pool.submit(self._contains, self._file_path("progress.md"), b"- ")
+        data = self._get_planning_data()
+        if not data['exists']:
+            return "⚠️ No plan found."
+        
+        issues = []
+        
+        # Check files
+        if not data['has_findings']:
+            issues.append("- Missing findings.md")
+        if not data['has_progress']:
+            issues.append("- Missing progress.md")
             
-        except Exception as e:
-            return f"❌ Error checking integrity: {str(e)}"
+        # Check tasks
+        pending = data['total'] - data['completed']
+        if pending > 0:
+            issues.append(f"- {pending} tasks pending in task_plan.md")
+        
+        # Check progress log
+        if has_bullets.result() is False:
+            issues.append("- progress.md seems empty (no bullet points)")
+        
+        if not issues:
+            return f"✅ Plan Integrity Check Passed!\n- All files present\n- All {data['total']} tasks completed\n- Progress logged"
+        
+        return "⚠️ Plan Incomplete / Issues Found:\n" + "\n".join(issues)
     
     # === Tool Wrappers with Widgets ===
     
@@ -1723,9 +2729,10 @@ Files: task_plan.md ✅ | findings.md {'✅' if data['has_findings'] else '❌'}
         output = self.create_plan(task_name, objective, phases)
         result.set_output(output)
         
-        # Create widget after operation completes
-        widget = PlanCreatedWidget(task_name, objective, self._get_planning_dir())
-        result.set_widget(widget)
+        # Create widget after operation completes, only for a plan that was written
+        if self._widgets_enabled() and output.startswith("✅"):
+            widget = PlanCreatedWidget(task_name, objective, self._get_planning_dir())
+            result.set_widget(widget)
         
         # Auto-open mini app tab if enabled
         if self.get_setting("mini_app_enabled") is not False:
@@ -1737,8 +2744,13 @@ Files: task_plan.md ✅ | findings.md {'✅' if data['has_findings'] else '❌'}
         result = ToolResult()
         output = self.ui_controller.get_tool_result_by_id(tool_uuid) if tool_uuid else None
         
-        widget = PlanCreatedWidget(task_name, objective, self._get_planning_dir())
-        result.set_widget(widget)
+        if self._widgets_enabled():
+            planning_dir = self._get_planning_dir()
+            widget = self._restore_widget(
+                tool_uuid, (planning_dir,),
+                lambda: PlanCreatedWidget(task_name, objective, planning_dir),
+            )
+            result.set_widget(widget)
         result.set_output(output)
         return result
     
@@ -1746,22 +2758,8 @@ Files: task_plan.md ✅ | findings.md {'✅' if data['has_findings'] else '❌'}
         result = ToolResult()
         
         # Get data and create widget synchronously
-        data = self._get_planning_data()
-        
-        if data['exists']:
-            widget = PlanningStatusWidget(
-                task_name=data['task_name'],
-                objective=data['objective'],
-                completed=data['completed'],
-                total=data['total'],
-                errors=data['errors'],
-                planning_dir=data['planning_dir'],
-                has_findings=data['has_findings'],
-                has_progress=data['has_progress'],
-            )
-        else:
-            widget = EmptyPlanWidget()
-        result.set_widget(widget)
+        if self._widgets_enabled():
+            result.set_widget(self._status_widget(self._get_planning_data()))
         
         # Get status output
         output = self.get_status()
@@ -1771,27 +2769,45 @@ Files: task_plan.md ✅ | findings.md {'✅' if data['has_findings'] else '❌'}
     
     def _restore_get_status(self, tool_uuid: str = None) -> ToolResult:
         result = ToolResult()
-        data = self._get_planning_data()
         output = self.ui_controller.get_tool_result_by_id(tool_uuid) if tool_uuid else self.get_status()
         
-        if data['exists']:
-            widget = PlanningStatusWidget(
-                task_name=data['task_name'],
-                objective=data['objective'],
-                completed=data['completed'],
-                total=data['total'],
-                errors=data['errors'],
-                planning_dir=data['planning_dir'],
-                has_findings=data['has_findings'],
-                has_progress=data['has_progress'],
-            )
-        else:
-            widget = EmptyPlanWidget()
-        
-        result.set_widget(widget)
+        if self._widgets_enabled():
+            data = self._get_planning_data()
+            # Everything the card shows; the todos compare by value
+            state = (data['task_name'], data['objective'], data['todos'], data['errors'],
+                     data['exists'], data['has_findings'], data['has_progress'], data['planning_dir'])
+            result.set_widget(self._restore_widget(tool_uuid, state, lambda: self._status_widget(data)))
         result.set_output(output)
         return result
     
+    def _widgets_enabled(self) -> bool:
+        """Whether tool results get a widget. Read live, since Newelle's
+        settings page writes it through another instance of the extension."""
+        if self.get_setting("tool_widgets") is False:
+            return False
+        self._sync_theme()
+        return True
+    
+    def _sync_theme(self):
+        """Apply the lightweight_theme setting before widgets are built;
+        a no-op unless it changed"""
+        _set_lightweight_theme(bool(self.get_setting("lightweight_theme")))
+    
+    def _status_widget(self, data: dict) -> Gtk.Widget:
+        if not data['exists']:
+            return EmptyPlanWidget()
+        return PlanningStatusWidget(
+            task_name=data['task_name'],
+            objective=data['objective'],
+            completed=data['completed'],
+            total=data['total'],
+            errors=data['errors'],
+            planning_dir=data['planning_dir'],
+            has_findings=data['has_findings'],
+            has_progress=data['has_progress'],
+            open_tooltip=data['open_tooltip'],
+        )
+    
     def _tool_mark_complete(self, phase_or_item: str) -> ToolResult:
         result = ToolResult()
         
@@ -1800,10 +2816,11 @@ Files: task_plan.md ✅ | findings.md {'✅' if data['has_findings'] else '❌'}
         result.set_output(output)
         
         # Create widget after operation completes (shows updated state)
-        data = self._get_planning_data()
-        if data['todos']:
-            widget = TodoListWidget(data['todos'], title="Tasks")
-            result.set_widget(widget)
+        if self._widgets_enabled():
+            data = self._get_planning_data()
+            if data['todos']:
+                widget = TodoListWidget(data['todos'], title="Tasks", stats=data['stats'])
+                result.set_widget(widget)
         
         return result
     
@@ -1811,10 +2828,13 @@ Files: task_plan.md ✅ | findings.md {'✅' if data['has_findings'] else '❌'}
         result = ToolResult()
         output = self.ui_controller.get_tool_result_by_id(tool_uuid) if tool_uuid else None
         
-        data = self._get_planning_data()
-        if data['todos']:
-            widget = TodoListWidget(data['todos'], title="Tasks")
-            result.set_widget(widget)
+        if self._widgets_enabled():
+            data = self._get_planning_data()
+            if data['todos']:
+                # Built fresh: a reused card would keep checkboxes the user
+                # toggled. The parsed plan behind it is cached already.
+                widget = TodoListWidget(data['todos'], title="Tasks", stats=data['stats'])
+                result.set_widget(widget)
         
         result.set_output(output)
         return result
@@ -1827,10 +2847,11 @@ Files: task_plan.md ✅ | findings.md {'✅' if data['has_findings'] else '❌'}
         result.set_output(output)
         
         # Create widget after operation completes (shows updated state with new item)
-        data = self._get_planning_data()
-        if data['todos']:
-            widget = TodoListWidget(data['todos'], title="Tasks")
-            result.set_widget(widget)
+        if self._widgets_enabled():
+            data = self._get_planning_data()
+            if data['todos']:
+                widget = TodoListWidget(data['todos'], title="Tasks", stats=data['stats'])
+                result.set_widget(widget)
         
         return result
     
@@ -1838,10 +2859,13 @@ Files: task_plan.md ✅ | findings.md {'✅' if data['has_findings'] else '❌'}
         result = ToolResult()
         output = self.ui_controller.get_tool_result_by_id(tool_uuid) if tool_uuid else None
         
-        data = self._get_planning_data()
-        if data['todos']:
-            widget = TodoListWidget(data['todos'], title="Tasks")
-            result.set_widget(widget)
+        if self._widgets_enabled():
+            data = self._get_planning_data()
+            if data['todos']:
+                # Built fresh: a reused card would keep checkboxes the user
+                # toggled. The parsed plan behind it is cached already.
+                widget = TodoListWidget(data['todos'], title="Tasks", stats=data['stats'])
+                result.set_widget(widget)
         
         result.set_output(output)
         return result
@@ -1850,8 +2874,9 @@ Files: task_plan.md ✅ | findings.md {'✅' if data['has_findings'] else '❌'}
         result = ToolResult()
         
         # Create widget with provided data
-        widget = FindingWidget(title, content, category, self._get_date())
-        result.set_widget(widget)
+        if self._widgets_enabled():
+            widget = FindingWidget(title, content, category, self._get_date())
+            result.set_widget(widget)
         
         # Run operation synchronously for consistency
         output = self.save_finding(title, content, category)
@@ -1863,8 +2888,9 @@ Files: task_plan.md ✅ | findings.md {'✅' if data['has_findings'] else '❌'}
         result = ToolResult()
         output = self.ui_controller.get_tool_result_by_id(tool_uuid) if tool_uuid else None
         
-        widget = FindingWidget(title, content, category)
-        result.set_widget(widget)
+        if self._widgets_enabled():
+            widget = self._restore_widget(tool_uuid, (), lambda: FindingWidget(title, content, category))
+            result.set_widget(widget)
         result.set_output(output)
         return result
     
@@ -1872,8 +2898,9 @@ Files: task_plan.md ✅ | findings.md {'✅' if data['has_findings'] else '❌'}
         result = ToolResult()
         
         # Create widget with provided data
-        widget = ErrorLogWidget(error, context, self._get_date())
-        result.set_widget(widget)
+        if self._widgets_enabled():
+            widget = ErrorLogWidget(error, context, self._get_date())
+            result.set_widget(widget)
         
         # Run operation synchronously for consistency
         output = self.log_error(error, context)
@@ -1885,22 +2912,39 @@ Files: task_plan.md ✅ | findings.md {'✅' if data['has_findings'] else '❌'}
         result = ToolResult()
         output = self.ui_controller.get_tool_result_by_id(tool_uuid) if tool_uuid else None
         
-        widget = ErrorLogWidget(error, context)
-        result.set_widget(widget)
+        if self._widgets_enabled():
+            widget = self._restore_widget(tool_uuid, (), lambda: ErrorLogWidget(error, context))
+            result.set_widget(widget)
         result.set_output(output)
         return result
     
+    def _restore_widget(self, tool_uuid: str, state: tuple, build) -> Gtk.Widget:
+        """Widget for a restored tool call, reused while state is unchanged.
+        A cached widget still placed in a chat is never handed out twice.
+        Only for widgets the user cannot change, as state is all it checks."""
+        if tool_uuid is None:
+            return build()
+        cached = self._widget_cache.get(tool_uuid)
+        if cached is not None and cached[0] == state and cached[1].get_parent() is None:
+            self._widget_cache.move_to_end(tool_uuid)
+            return cached[1]
+        widget = build()
+        self._widget_cache[tool_uuid] = (state, widget)
+        self._widget_cache.move_to_end(tool_uuid)
+        if len(self._widget_cache) > _WIDGET_CACHE_SIZE:
+            self._widget_cache.popitem(last=False)
+        return widget
+    
     def _tool_simple(self, func, *args, **kwargs) -> ToolResult:
         """Generic wrapper for tools without widgets"""
         result = ToolResult()
         
-        # Run operation in thread
+        # Run operation on a pooled thread
         def run():
             output = func(*args, **kwargs)
             result.set_output(output)
         
-        thread = threading.Thread(target=run)
-        thread.start()
+        self._tool_pool.submit(run)
         return result
     
     def _restore_simple(self, tool_uuid: str = None) -> ToolResult:
@@ -1909,7 +2953,34 @@ Files: task_plan.md ✅ | findings.md {'✅' if data['has_findings'] else '❌'}
         result.set_output(output)
         return result
     
+    # Entry points of the widgetless tools. They are methods rather than
+    # lambdas so the tool list can be built once; the parameters make up
+    # each tool's schema.
+    
+    def _tool_read_plan(self, start_char: int = 0) -> ToolResult:
+        return self._tool_simple(self.read_plan, start_char)
+    
+    def _tool_update_plan(self, section: str, content: str) -> ToolResult:
+        return self._tool_simple(self.update_plan, section, content)
+    
+    def _tool_read_findings(self, start_char: int = 0) -> ToolResult:
+        return self._tool_simple(self.read_findings, start_char)
+    
+    def _tool_log_progress(self, entry: str, include_timestamp: bool = True) -> ToolResult:
+        return self._tool_simple(self.log_progress, entry, include_timestamp)
+    
+    def _tool_check_plan_integrity(self) -> ToolResult:
+        return self._tool_simple(self.check_plan_integrity)
+    
+    def _tool_cleanup_plan(self) -> ToolResult:
+        return self._tool_simple(self.cleanup_plan)
+    
     def get_tools(self) -> list:
+        if self._tools is None:
+            self._tools = self._build_tools()
+        return self._tools
+    
+    def _build_tools(self) -> list:
         return [
             Tool(
                 name="create_plan",
@@ -1922,7 +2993,7 @@ Files: task_plan.md ✅ | findings.md {'✅' if data['has_findings'] else '❌'}
             Tool(
                 name="read_plan",
                 description="Read the current task_plan.md. Use 'start_char' to read from an offset if truncated.",
-                func=lambda start_char=0: self._tool_simple(self.read_plan, start_char),
+                func=self._tool_read_plan,
                 title="Read Plan",
                 restore_func=self._restore_simple,
                 tools_group="Planning",
@@ -1930,7 +3001,7 @@ Files: task_plan.md ✅ | findings.md {'✅' if data['has_findings'] else '❌'}
             Tool(
                 name="update_plan",
                 description="Update a section in the task plan.",
-                func=lambda section, content: self._tool_simple(self.update_plan, section, content),
+                func=self._tool_update_plan,
                 title="Update Plan",
                 restore_func=self._restore_simple,
                 tools_group="Planning",
@@ -1962,7 +3033,7 @@ Files: task_plan.md ✅ | findings.md {'✅' if data['has_findings'] else '❌'}
             Tool(
                 name="read_findings",
                 description="Read all saved findings. Use 'start_char' to read from an offset.",
-                func=lambda start_char=0: self._tool_simple(self.read_findings, start_char),
+                func=self._tool_read_findings,
                 title="Read Findings",
                 restore_func=self._restore_simple,
                 tools_group="Planning",
@@ -1970,7 +3041,7 @@ Files: task_plan.md ✅ | findings.md {'✅' if data['has_findings'] else '❌'}
             Tool(
                 name="log_progress",
                 description="Log a progress entry to the session log.",
-                func=lambda entry, include_timestamp=True: self._tool_simple(self.log_progress, entry, include_timestamp),
+                func=self._tool_log_progress,
                 title="Log Progress",
                 restore_func=self._restore_simple,
                 tools_group="Planning",
@@ -1994,7 +3065,7 @@ Files: task_plan.md ✅ | findings.md {'✅' if data['has_findings'] else '❌'}
             Tool(
                 name="check_plan_integrity",
                 description="Verify if all tasks are complete and files exist (runs logic similar to check-complete.sh).",
-                func=lambda: self._tool_simple(self.check_plan_integrity),
+                func=self._tool_check_plan_integrity,
                 title="Check Integrity",
                 restore_func=self._restore_simple,
                 tools_group="Planning",
@@ -2002,7 +3073,7 @@ Files: task_plan.md ✅ | findings.md {'✅' if data['has_findings'] else '❌'}
             Tool(
                 name="cleanup_plan",
                 description="Remove all planning files after completion.",
-                func=lambda: self._tool_simple(self.cleanup_plan),
+                func=self._tool_cleanup_plan,
                 title="Cleanup Plan",
                 restore_func=self._restore_simple,
                 tools_group="Planning",